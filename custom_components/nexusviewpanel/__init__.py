@@ -1,22 +1,49 @@
 """The NexusViewPanel integration."""
-from datetime import timedelta
+import asyncio
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_API_TOKEN, CONF_HOST, CONF_PORT, Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.core import HomeAssistant, callback
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.helpers.update_coordinator import UpdateFailed
 
-from .api import NexusViewPanelApiClient, ApiError
+from .api import NexusViewPanelApiClient, ApiError, CircuitOpenError, CommandPatch
+from .breaker import STATE_CLOSED, STATE_OPEN
+from .config_flow import get_entry_options
 from .const import (
     DOMAIN,
     LOGGER,
     COORDINATOR_DEVICE,
     COORDINATOR_CONFIG,
     NEXUS_API_CLIENT,
-    DEVICE_UPDATE_INTERVAL,
-    CONFIG_UPDATE_INTERVAL,
+    VALUE_FILTERS,
+    POLL_POLICY,
+    POLL_SCHEDULER,
+    PUSH_RECEIVER,
+    CONF_BATTERY_DEADBAND,
+    CONF_BATTERY_MIN_INTERVAL,
+    CONF_BRIGHTNESS_DEADBAND,
+    CONF_BRIGHTNESS_MIN_INTERVAL,
+    CONF_CONFIG_INTERVAL,
+    CONF_CONNECT_TIMEOUT,
+    CONF_DEVICE_INTERVAL,
+    CONF_HEDGED_READS,
+    CONF_METRICS,
+    CONF_MAX_CONCURRENT,
+    CONF_READ_TIMEOUT,
+    ADAPTIVE_LOW_BATTERY,
+    DEVICE_KEY_BATTERY,
+    DEVICE_KEY_SCREEN_ON,
 )
+from .coordinator import NexusDataUpdateCoordinator
+from .filters import SignificantChangeFilter
+from .push import NexusPushReceiver, async_register_push_view
+from .scheduler import AdaptivePollPolicy, NexusPollScheduler
+from .services import async_setup_services
+from .snapshot import NexusSnapshotCache
+from .session import async_get_panel_session, async_release_panel_session
 
 PLATFORMS: list[Platform] = [
     Platform.SWITCH,
@@ -26,67 +53,285 @@ PLATFORMS: list[Platform] = [
     Platform.BUTTON,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the NexusViewPanel services."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up NexusViewPanel from a config entry."""
 
+    options = get_entry_options(entry)
     api_client = NexusViewPanelApiClient(
         host=entry.data[CONF_HOST],
         port=entry.data[CONF_PORT],
         token=entry.data[CONF_API_TOKEN],
-        session=async_get_clientsession(hass),
+        session=await async_get_panel_session(hass),
+        max_concurrent=options[CONF_MAX_CONCURRENT],
+        connect_timeout=options[CONF_CONNECT_TIMEOUT],
+        read_timeout=options[CONF_READ_TIMEOUT],
+        metrics=options[CONF_METRICS],
+        hedged_reads=options[CONF_HEDGED_READS],
+    )
+
+    # The coordinators have no timer of their own; one scheduler shared by
+    # all entries staggers their refreshes and bounds concurrent requests.
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (scheduler := domain_data.get(POLL_SCHEDULER)) is None:
+        scheduler = domain_data[POLL_SCHEDULER] = NexusPollScheduler(hass)
+    poll_policy = AdaptivePollPolicy(
+        entry.entry_id,
+        scheduler,
+        {
+            "device": options[CONF_DEVICE_INTERVAL],
+            "config": options[CONF_CONFIG_INTERVAL],
+        },
     )
-    
-    device_interval = entry.data.get("device_interval", DEVICE_UPDATE_INTERVAL)
-    config_interval = entry.data.get("config_interval", CONFIG_UPDATE_INTERVAL)
+
+    async def async_fetch(section: str) -> Any:
+        """Fetch a section, through the combined endpoint if the panel has one.
+
+        A combined response also updates the coordinator of the other section.
+        """
+        if (state := await api_client.async_get_state()) is None:
+            if section == "device":
+                return await api_client.async_get_device()
+            return await api_client.async_get_config()
+
+        other = "config" if section == "device" else "device"
+        coordinator = coordinators[other]
+        if state[other] != coordinator.data:
+            poll_policy.async_record_poll(other, coordinator.data is not None)
+            coordinator.live = True
+            coordinator.async_set_updated_data(state[other])
+        elif not coordinator.live:
+            # Same as the restored snapshot, but now confirmed by the panel.
+            coordinator.live = True
+            coordinator.async_update_listeners()
+        return state[section]
 
     async def async_update_device_data():
         """Fetch data from /api/device."""
         try:
-            return await api_client.async_get_device()
+            data = await async_fetch("device")
         except ApiError as err:
+            poll_policy.async_record_failure("device")
             raise UpdateFailed(f"Error communicating with API: {err}")
+        poll_policy.async_record_poll(
+            "device",
+            device_coordinator.data is not None and data != device_coordinator.data,
+        )
+        return data
 
-    device_coordinator = DataUpdateCoordinator(
+    device_coordinator = NexusDataUpdateCoordinator(
         hass,
         LOGGER,
         name=f"{DOMAIN}_device_status",
         update_method=async_update_device_data,
-        update_interval=timedelta(seconds=device_interval),
     )
 
     async def async_update_config_data():
         """Fetch data from /api/config."""
         try:
-            return await api_client.async_get_config()
+            data = await async_fetch("config")
         except ApiError as err:
+            poll_policy.async_record_failure("config")
             raise UpdateFailed(f"Error communicating with API: {err}")
+        poll_policy.async_record_poll(
+            "config",
+            config_coordinator.data is not None and data != config_coordinator.data,
+        )
+        return data
 
-    config_coordinator = DataUpdateCoordinator(
+    config_coordinator = NexusDataUpdateCoordinator(
         hass,
         LOGGER,
         name=f"{DOMAIN}_config",
         update_method=async_update_config_data,
-        update_interval=timedelta(seconds=config_interval),
+        # An unchanged /api/config must not notify entities or write states.
+        always_update=False,
     )
-    
-    await device_coordinator.async_config_entry_first_refresh()
-    await config_coordinator.async_config_entry_first_refresh()
+    coordinators = {"device": device_coordinator, "config": config_coordinator}
+
+    # Show the last known state (and tab buttons) until the panel answers.
+    snapshot = NexusSnapshotCache(hass, entry.entry_id)
+    device_data, config_data = await snapshot.async_load()
+    # Only a found endpoint is trusted; a missing one is probed again on
+    # every start, so a panel that gains it after an update is detected.
+    if snapshot.capabilities.get("state_endpoint"):
+        api_client.state_endpoint = True
+    if device_data is not None:
+        device_coordinator.async_set_updated_data(device_data)
+    if config_data is not None:
+        config_coordinator.async_set_updated_data(config_data)
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+    domain_data[entry.entry_id] = {
         NEXUS_API_CLIENT: api_client,
         COORDINATOR_DEVICE: device_coordinator,
         COORDINATOR_CONFIG: config_coordinator,
+        POLL_POLICY: poll_policy,
+        VALUE_FILTERS: {
+            "battery": SignificantChangeFilter(
+                options[CONF_BATTERY_DEADBAND], options[CONF_BATTERY_MIN_INTERVAL]
+            ),
+            "brightness": SignificantChangeFilter(
+                options[CONF_BRIGHTNESS_DEADBAND], options[CONF_BRIGHTNESS_MIN_INTERVAL]
+            ),
+        },
     }
 
+    entry.async_on_unload(
+        scheduler.async_add_job(
+            f"{entry.entry_id}_device",
+            device_coordinator.async_refresh,
+            poll_policy.intervals["device"],
+        )
+    )
+
+    async def async_poll_config() -> None:
+        """Poll the config, unless every device poll fetches it anyway."""
+        if not api_client.state_endpoint:
+            await config_coordinator.async_refresh()
+
+    entry.async_on_unload(
+        scheduler.async_add_job(
+            f"{entry.entry_id}_config",
+            async_poll_config,
+            poll_policy.intervals["config"],
+        )
+    )
+
+    @callback
+    def async_device_updated() -> None:
+        """Let the poll policy back off while the panel is idle."""
+        data = device_coordinator.data or {}
+        battery = data.get(DEVICE_KEY_BATTERY)
+        poll_policy.async_set_idle(
+            data.get(DEVICE_KEY_SCREEN_ON) is False
+            or (isinstance(battery, (int, float)) and battery < ADAPTIVE_LOW_BATTERY)
+        )
+
+    entry.async_on_unload(device_coordinator.async_add_listener(async_device_updated))
+
+    @callback
+    def async_save_snapshot() -> None:
+        """Persist the last good data for the next start."""
+        snapshot.async_update(
+            device_coordinator.data if device_coordinator.last_update_success else None,
+            config_coordinator.data if config_coordinator.last_update_success else None,
+            {"state_endpoint": True} if api_client.state_endpoint else {},
+        )
+
+    entry.async_on_unload(snapshot.async_flush)
+    entry.async_on_unload(device_coordinator.async_add_listener(async_save_snapshot))
+    entry.async_on_unload(config_coordinator.async_add_listener(async_save_snapshot))
+
+    @callback
+    def async_breaker_changed() -> None:
+        """Mark the panel unavailable at once when it stops responding."""
+        if api_client.breaker.state == STATE_OPEN:
+            err = CircuitOpenError("Panel is not responding")
+            device_coordinator.async_set_update_error(err)
+            config_coordinator.async_set_update_error(err)
+        elif api_client.breaker.state == STATE_CLOSED:
+            hass.async_create_task(device_coordinator.async_request_refresh())
+            hass.async_create_task(config_coordinator.async_request_refresh())
+
+    entry.async_on_unload(api_client.breaker.add_listener(async_breaker_changed))
+
+    @callback
+    def async_command_sent(_path: str, patch: CommandPatch) -> None:
+        """Apply the known effect of a command, or poll fast if it is unknown.
+
+        A known effect is verified by the next scheduled poll.
+        """
+        if not patch:
+            poll_policy.async_notify_activity()
+        for section, changes in patch.items():
+            coordinators[section].async_patch(changes)
+
+    entry.async_on_unload(api_client.add_command_listener(async_command_sent))
+
+    push_receiver = NexusPushReceiver(
+        hass,
+        entry.entry_id,
+        entry.data[CONF_API_TOKEN],
+        poll_policy,
+    )
+    domain_data[entry.entry_id][PUSH_RECEIVER] = push_receiver
+    entry.async_on_unload(push_receiver.async_shutdown)
+    async_register_push_view(hass)
+
+    entry.async_on_unload(entry.add_update_listener(async_options_updated))
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Don't hold up startup (or retry the setup) for slow or offline panels:
+    # entities start unavailable and fill in once the first data arrives.
+    async def async_first_refresh() -> None:
+        """Fetch device and config data concurrently."""
+        await asyncio.gather(
+            device_coordinator.async_refresh(), config_coordinator.async_refresh()
+        )
+        for coordinator in (device_coordinator, config_coordinator):
+            if not coordinator.last_update_success:
+                LOGGER.warning(
+                    "%s is not reachable yet, retrying in the background: %s",
+                    entry.title,
+                    coordinator.last_exception,
+                )
+                break
+
+    entry.async_create_background_task(
+        hass, async_first_refresh(), f"{DOMAIN}_first_refresh_{entry.entry_id}"
+    )
+
     return True
 
 
+async def async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options to the running client and poll policy.
+
+    Nothing is reloaded, so entities and coordinator data stay as they are.
+    """
+    options = get_entry_options(entry)
+    data = hass.data[DOMAIN][entry.entry_id]
+    api_client = data[NEXUS_API_CLIENT]
+    api_client.set_limits(
+        options[CONF_CONNECT_TIMEOUT],
+        options[CONF_READ_TIMEOUT],
+        options[CONF_MAX_CONCURRENT],
+    )
+    api_client.set_metrics(options[CONF_METRICS])
+    api_client.hedged_reads = options[CONF_HEDGED_READS]
+    data[POLL_POLICY].async_set_base_intervals(
+        {
+            "device": options[CONF_DEVICE_INTERVAL],
+            "config": options[CONF_CONFIG_INTERVAL],
+        }
+    )
+    for name, deadband, min_interval in (
+        ("battery", CONF_BATTERY_DEADBAND, CONF_BATTERY_MIN_INTERVAL),
+        ("brightness", CONF_BRIGHTNESS_DEADBAND, CONF_BRIGHTNESS_MIN_INTERVAL),
+    ):
+        value_filter = data[VALUE_FILTERS][name]
+        value_filter.deadband = options[deadband]
+        value_filter.min_interval = options[min_interval]
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
+        await async_release_panel_session(hass, entry.entry_id)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the warm-start snapshot of a deleted entry."""
+    await NexusSnapshotCache(hass, entry.entry_id).async_remove()
@@ -1,9 +1,58 @@
 """API Client for NexusViewPanel."""
 import asyncio
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from hashlib import blake2b
+import heapq
+from http import HTTPStatus
+import itertools
+from json import JSONDecodeError
+import time
 from typing import Any
-from aiohttp import ClientSession, ClientResponseError
+from aiohttp import (
+    ClientConnectionError,
+    ClientResponseError,
+    ClientSession,
+    ClientTimeout,
+    hdrs,
+)
+from homeassistant.util.json import json_loads
 
-from .const import LOGGER
+from .breaker import STATE_HALF_OPEN, CircuitBreaker
+
+from .const import (
+    COMMAND_COALESCE_WINDOW,
+    DEVICE_KEY_SCREEN_ON,
+    GET_FRESHNESS_WINDOW,
+    HEDGE_MIN_SAMPLES,
+    LOGGER,
+    PRIORITY_COMMAND,
+    PRIORITY_REFRESH,
+    REQUEST_CONNECT_TIMEOUT,
+    REQUEST_MAX_CONCURRENT,
+    REQUEST_READ_TIMEOUT,
+    REQUEST_TIMEOUT_FLOOR,
+)
+from .metrics import PanelMetrics, RttEstimator
+from .projection import CONFIG_PROJECTION, project
+from .trace import RequestTrace
+
+# Priority of GET requests made in the current task. The poll scheduler sets
+# PRIORITY_POLL for its refreshes; everything else counts as a forced refresh.
+request_priority: ContextVar[int] = ContextVar(
+    "nexusviewpanel_request_priority", default=PRIORITY_REFRESH
+)
+
+# Known effect of a command: section ("device"/"config") -> key path -> value.
+CommandPatch = dict[str, dict[tuple[str, ...], Any]]
+
+# Responses that are reduced to the fields the entities use.
+_PROJECTIONS: dict[str, Any] = {
+    "/config": CONFIG_PROJECTION,
+    "/state": {"device": None, "config": CONFIG_PROJECTION},
+}
 
 # Define custom exceptions
 class ApiError(Exception):
@@ -12,91 +61,559 @@ class ApiError(Exception):
 class AuthError(ApiError):
     """Exception to indicate an authentication error."""
 
+class CircuitOpenError(ApiError):
+    """Exception to indicate that the panel is skipped as unreachable."""
+
+class NotSupportedError(ApiError):
+    """Exception to indicate that the panel does not know an endpoint."""
+
+class BadResponseError(ApiError):
+    """Exception to indicate an HTTP error status or an unreadable body."""
+
+
+def _fail_shared(shared: asyncio.Future[Any], err: BaseException) -> None:
+    """Pass the failure of a shared request on to the callers waiting for it."""
+    if isinstance(err, asyncio.CancelledError):
+        shared.cancel()
+    else:
+        shared.set_exception(err)
+        # Only awaited by duplicate callers, don't warn if there were none.
+        shared.exception()
+
+
+@dataclass
+class _ConditionalCache:
+    """Last response of a GET endpoint that is fetched conditionally."""
+
+    etag: str | None
+    digest: bytes
+    data: Any
+
+
+class _RequestQueue:
+    """Limits concurrent requests to one panel, lowest priority value first."""
+
+    def __init__(self, max_concurrent: int) -> None:
+        """Initialize the queue."""
+        self.max_concurrent = max_concurrent
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._seq = itertools.count()
+
+    @asynccontextmanager
+    async def slot(self, priority: int) -> AsyncIterator[None]:
+        """Wait for a free request slot and hold it."""
+        if self._active < self.max_concurrent and not self._waiters:
+            self._active += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (priority, next(self._seq), waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # The slot may have been handed over just before cancellation.
+                if waiter.done() and not waiter.cancelled():
+                    self._release()
+                raise
+        try:
+            yield
+        finally:
+            self._release()
+
+    @property
+    def has_free_slot(self) -> bool:
+        """Return whether a slot would be granted without waiting."""
+        return self._active < self.max_concurrent and not self._waiters
+
+    def set_max_concurrent(self, max_concurrent: int) -> None:
+        """Change the limit; running requests above a lower limit finish."""
+        self.max_concurrent = max_concurrent
+        self._fill()
+
+    def _release(self) -> None:
+        """Free a slot and hand it to the next waiter."""
+        self._active -= 1
+        self._fill()
+
+    def _fill(self) -> None:
+        """Hand free slots to the waiters, lowest priority value first."""
+        while self._waiters and self._active < self.max_concurrent:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                self._active += 1
+                waiter.set_result(None)
+
 
 class NexusViewPanelApiClient:
     """Class to manage API calls."""
 
     def __init__(
-        self, host: str, port: int, token: str, session: ClientSession
+        self,
+        host: str,
+        port: int,
+        token: str,
+        session: ClientSession,
+        max_concurrent: int = REQUEST_MAX_CONCURRENT,
+        freshness: float = GET_FRESHNESS_WINDOW,
+        connect_timeout: float = REQUEST_CONNECT_TIMEOUT,
+        read_timeout: float = REQUEST_READ_TIMEOUT,
+        metrics: bool = True,
+        hedged_reads: bool = False,
     ) -> None:
         """Initialize the API client."""
         self._base_url = f"http://{host}:{port}/api"
+        self.breaker = CircuitBreaker(f"NexusViewPanel {host}:{port}")
+        self.metrics = PanelMetrics() if metrics else None
+        self.trace = RequestTrace()
         self._headers = {"Authorization": f"Bearer {token}"}
         self._session = session
+        # Round-trip times per GET endpoint; /config and /state are larger
+        # and slower than /device. Commands (e.g. a tab reload) take as long
+        # as the panel needs, so they only have the read_timeout limit.
+        self.rtt: dict[str, RttEstimator] = {}
+        # Send a second GET when the first is slower than the usual p95.
+        self.hedged_reads = hedged_reads
+        self._queue = _RequestQueue(max_concurrent)
+        self.set_limits(connect_timeout, read_timeout, max_concurrent)
+        self._queued_commands: dict[tuple, asyncio.Future[Any]] = {}
+        self._inflight_gets: dict[tuple, asyncio.Future[Any]] = {}
+        self._fresh_gets: dict[tuple, tuple[float, Any]] = {}
+        self._freshness = freshness
+        self._conditional: dict[str, _ConditionalCache] = {}
+        self._command_listeners: list[Callable[[str, CommandPatch], None]] = []
+        self._latest_commands: dict[str, object] = {}
+        # Whether the panel serves /state; None until probed.
+        self.state_endpoint: bool | None = None
+
+    def set_limits(
+        self, connect_timeout: float, read_timeout: float, max_concurrent: int
+    ) -> None:
+        """Apply timeout limits and the concurrency limit to the following requests.
+
+        The timeout of each request adapts to the panel's round-trip time,
+        connect_timeout and read_timeout are its ceilings.
+        """
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        for rtt in self.rtt.values():
+            rtt.ceiling = read_timeout
+        self._queue.set_max_concurrent(max_concurrent)
+
+    def set_metrics(self, enabled: bool) -> None:
+        """Turn request metrics on (starting empty) or off.
+
+        Hedged reads need the latency metrics and stop while they are off.
+        """
+        if not enabled:
+            self.metrics = None
+        elif self.metrics is None:
+            self.metrics = PanelMetrics()
+
+    def add_command_listener(
+        self, listener: Callable[[str, CommandPatch], None]
+    ) -> Callable[[], None]:
+        """Call listener with the path and patch of every successfully sent command."""
+        self._command_listeners.append(listener)
+
+        def remove_listener() -> None:
+            self._command_listeners.remove(listener)
+
+        return remove_listener
+
+    async def _request(
+        self, method: str, path: str, conditional: bool = False, **kwargs
+    ) -> dict[str, Any] | None:
+        """Queue an API request behind the other requests to this panel.
+
+        Commands go first, then forced refreshes, then scheduled polls. A
+        command identical to one that is still queued shares its result
+        instead of being sent twice.
+        """
+        # Fail fast while the panel is unreachable; the probe itself is only
+        # taken in _send, right before the request goes out.
+        if self.breaker.blocked:
+            raise self._circuit_open_error()
+
+        if method == hdrs.METH_GET:
+            return await self._shared_get(path, conditional, **kwargs)
 
-    async def _request(self, method: str, path: str, **kwargs) -> dict[str, Any] | None:
-        """Make an API request."""
+        key = (method, path, repr(kwargs))
+        if (queued := self._queued_commands.get(key)) is not None:
+            LOGGER.debug("Dropping duplicate queued command %s %s", method, path)
+            return await asyncio.shield(queued)
+
+        queued = self._queued_commands[key] = asyncio.get_running_loop().create_future()
+        try:
+            async with self._queue.slot(PRIORITY_COMMAND):
+                del self._queued_commands[key]
+                result = await self._send(method, path, conditional, **kwargs)
+        except BaseException as err:
+            if self._queued_commands.get(key) is queued:
+                del self._queued_commands[key]
+            _fail_shared(queued, err)
+            raise
+        queued.set_result(result)
+        return result
+
+    async def _shared_get(
+        self, path: str, conditional: bool = False, **kwargs
+    ) -> dict[str, Any] | None:
+        """Make a GET request, sharing it with concurrent identical GETs.
+
+        A result younger than the freshness window is returned without a
+        new request; commands invalidate those results.
+        """
+        key = (path, repr(kwargs))
+        loop = asyncio.get_running_loop()
+        if (fresh := self._fresh_gets.get(key)) and loop.time() - fresh[0] < self._freshness:
+            return fresh[1]
+        if (inflight := self._inflight_gets.get(key)) is not None:
+            LOGGER.debug("Joining in-flight GET %s", path)
+            return await asyncio.shield(inflight)
+
+        inflight = self._inflight_gets[key] = loop.create_future()
+        try:
+            async with self._queue.slot(request_priority.get()):
+                result = await self._hedged_get(path, conditional, **kwargs)
+        except BaseException as err:
+            _fail_shared(inflight, err)
+            raise
+        finally:
+            del self._inflight_gets[key]
+        self._fresh_gets[key] = (loop.time(), result)
+        inflight.set_result(result)
+        return result
+
+    async def _hedged_get(
+        self, path: str, conditional: bool = False, **kwargs
+    ) -> dict[str, Any] | None:
+        """Make a GET request, sent a second time if the first is slow.
+
+        With hedged reads on, a second identical request is sent once the
+        first takes longer than the endpoint's p95 latency; the first
+        successful response wins and the other request is cancelled. The
+        second request needs a queue slot of its own and is only sent if
+        one is free right away.
+        """
+        if not self.hedged_reads or (delay := self._hedge_delay(path)) is None:
+            return await self._send(hdrs.METH_GET, path, conditional, **kwargs)
+
+        first = asyncio.ensure_future(
+            self._send(hdrs.METH_GET, path, conditional, **kwargs)
+        )
+        pending: set[asyncio.Future[Any]] = {first}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return first.result()
+            if not self._queue.has_free_slot:
+                return await first
+            LOGGER.debug("Hedging GET %s after %.3f s", path, delay)
+            pending.add(
+                asyncio.ensure_future(
+                    self._send_in_slot(hdrs.METH_GET, path, conditional, **kwargs)
+                )
+            )
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+            # Both failed, report the first failure.
+            return first.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _send_in_slot(
+        self, method: str, path: str, conditional: bool = False, **kwargs
+    ) -> dict[str, Any] | None:
+        """Make an API request in a queue slot of its own."""
+        async with self._queue.slot(request_priority.get()):
+            return await self._send(method, path, conditional, **kwargs)
+
+    def _endpoint_rtt(self, path: str) -> RttEstimator:
+        """Return the round-trip time estimate of a GET endpoint."""
+        if (rtt := self.rtt.get(path)) is None:
+            rtt = self.rtt[path] = RttEstimator(
+                REQUEST_TIMEOUT_FLOOR, self._read_timeout
+            )
+        return rtt
+
+    def _hedge_delay(self, path: str) -> float | None:
+        """Return the p95 latency of a GET endpoint, if enough is known."""
+        if self.metrics is None:
+            return None
+        stats = self.metrics.endpoint(hdrs.METH_GET, path)
+        if stats.requests < HEDGE_MIN_SAMPLES:
+            return None
+        return stats.percentile(0.95)
+
+    async def _send(
+        self, method: str, path: str, conditional: bool = False, **kwargs
+    ) -> dict[str, Any] | None:
+        """Make an API request.
+
+        With conditional=True the previous response of the path is
+        revalidated: a 304 or a byte-identical body returns the previously
+        returned object unchanged, so callers can detect "no change" by identity.
+        """
         url = f"{self._base_url}{path}"
+        headers = self._headers
+        cache = self._conditional.get(path) if conditional else None
+        if cache and cache.etag:
+            headers = {**headers, hdrs.IF_NONE_MATCH: cache.etag}
         
-        LOGGER.debug(f"Sending {method} to {url} with data: {kwargs.get('json') or kwargs.get('params')}")
+        LOGGER.debug("Sending %s to %s with data: %s", method, url, kwargs.get("json") or kwargs.get("params"))
 
+        stats = self.metrics.endpoint(method, path) if self.metrics is not None else None
+        trace = self.trace if self.trace.enabled else None
+        rtt = self._endpoint_rtt(path) if method == hdrs.METH_GET else None
+        request_timeout = rtt.timeout if rtt else self._read_timeout
+        timeout = ClientTimeout(
+            total=None,
+            sock_connect=min(self._connect_timeout, request_timeout),
+            sock_read=request_timeout,
+        )
+        if not self.breaker.allow_request():
+            raise self._circuit_open_error()
+        probe = self.breaker.state == STATE_HALF_OPEN
+        start = time.monotonic()
         try:
             async with self._session.request(
-                method, url, headers=self._headers, timeout=10, **kwargs
+                method, url, headers=headers, timeout=timeout, **kwargs
             ) as response:
+                self.breaker.record_success()
                 
-                LOGGER.debug(f"Response status from {url}: {response.status}")
-                LOGGER.debug(f"Response content-type: {response.content_type}")
-                
+                LOGGER.debug("Response status from %s: %s", url, response.status)
+                LOGGER.debug("Response content-type: %s", response.content_type)
+
+                if cache and response.status == HTTPStatus.NOT_MODIFIED:
+                    LOGGER.debug("%s not modified", url)
+                    elapsed = time.monotonic() - start
+                    if rtt:
+                        rtt.sample(elapsed)
+                    if stats:
+                        stats.observe(elapsed, 0)
+                    if trace:
+                        trace.record(method, path, kwargs.get("params"), response.status, elapsed)
+                    return cache.data
+
                 response.raise_for_status() 
+                body = await response.read()
+                elapsed = time.monotonic() - start
+                if rtt:
+                    rtt.sample(elapsed)
+                if stats:
+                    stats.observe(elapsed, len(body))
+                if trace:
+                    trace.record(method, path, kwargs.get("params"), response.status, elapsed, body)
                 
                 if response.status == 200:
                     if response.content_type == "application/json":
-                        json_data = await response.json()
-                        LOGGER.debug(f"Response JSON: {json_data}")
+                        if not conditional:
+                            json_data = self._decode(path, body)
+                            LOGGER.debug("Response JSON: %s", json_data)
+                            return json_data
+
+                        etag = response.headers.get(hdrs.ETAG)
+                        digest = blake2b(body, digest_size=16).digest()
+                        if cache and cache.digest == digest:
+                            LOGGER.debug("%s unchanged", url)
+                            cache.etag = etag
+                            return cache.data
+
+                        json_data = self._decode(path, body)
+                        LOGGER.debug("Response JSON: %s", json_data)
+                        self._conditional[path] = _ConditionalCache(etag, digest, json_data)
                         return json_data
                     else:
-                        text_data = await response.text()
+                        text_data = body.decode(response.charset or "utf-8", "replace")
                         LOGGER.warning(
-                            f"API-Anfrage an {url} war erfolgreich (Status 200), aber der Content-Type ist '{response.content_type}', nicht 'application/json'. "
-                            f"Empfangener Text: {text_data}"
+                            "API-Anfrage an %s war erfolgreich (Status 200), aber der Content-Type ist '%s', nicht 'application/json'. "
+                            "Empfangener Text: %s",
+                            url,
+                            response.content_type,
+                            text_data,
                         )
                         return None
                 
                 return None
 
         except ClientResponseError as err:
+            if trace:
+                trace.record(method, path, kwargs.get("params"), err.status, time.monotonic() - start, error=err)
             if err.status == 401 or err.status == 403:
+                if stats:
+                    stats.auth_errors += 1
                 LOGGER.error("Authentifizierungsfehler: API-Token prüfen.")
                 raise AuthError("Authentifizierung fehlgeschlagen") from err
+            elif err.status == HTTPStatus.NOT_FOUND:
+                if stats:
+                    stats.http_errors += 1
+                LOGGER.debug("%s nicht gefunden", url)
+                raise NotSupportedError(f"Nicht unterstützt: {path}") from err
             else:
-                LOGGER.error(f"API-Anfrage fehlgeschlagen (ClientResponseError): {err}")
-                raise ApiError(f"API-Anfrage fehlgeschlagen: {err}") from err
-        except asyncio.TimeoutError:
-            LOGGER.error(f"Timeout beim Verbinden mit {url}")
+                if stats:
+                    stats.http_errors += 1
+                LOGGER.error("API-Anfrage fehlgeschlagen (ClientResponseError): %s", err)
+                raise BadResponseError(f"API-Anfrage fehlgeschlagen: {err}") from err
+        except asyncio.TimeoutError as err:
+            if trace:
+                trace.record(method, path, kwargs.get("params"), None, time.monotonic() - start, error=err)
+            # Logged once per outage by the circuit breaker.
+            LOGGER.debug(
+                "Timeout beim Verbinden mit %s nach %.2f s", url, request_timeout
+            )
+            if stats:
+                stats.timeouts += 1
+            if rtt:
+                rtt.record_timeout()
+            self.breaker.record_failure()
             raise ApiError("Anfrage-Timeout") from None
+        except ClientConnectionError as err:
+            if trace:
+                trace.record(method, path, kwargs.get("params"), None, time.monotonic() - start, error=err)
+            LOGGER.debug("Verbindung zu %s fehlgeschlagen: %s", url, err)
+            if stats:
+                stats.connection_errors += 1
+            self.breaker.record_failure()
+            raise ApiError(f"Verbindung fehlgeschlagen: {err}") from err
+        except JSONDecodeError as err:
+            if trace:
+                trace.record(method, path, kwargs.get("params"), None, time.monotonic() - start, error=err)
+            LOGGER.debug("Ungültige JSON-Antwort von %s: %s", url, err)
+            raise BadResponseError(f"Ungültige Antwort: {err}") from err
         except Exception as e:
-            LOGGER.error(f"Unerwarteter Fehler bei der API-Anfrage: {e}")
+            if trace:
+                trace.record(method, path, kwargs.get("params"), None, time.monotonic() - start, error=e)
+            LOGGER.error("Unerwarteter Fehler bei der API-Anfrage: %s", e)
             raise ApiError(f"Unerwarteter API-Fehler: {e}") from e
+        finally:
+            if probe:
+                # No-op once the probe closed or reopened the breaker.
+                self.breaker.release_probe()
+
+    def _circuit_open_error(self) -> CircuitOpenError:
+        """Return the error for a request rejected by the circuit breaker."""
+        return CircuitOpenError(
+            f"Gerät nicht erreichbar, nächster Versuch in {self.breaker.retry_in:.0f} s"
+        )
+
+    @staticmethod
+    def _decode(path: str, body: bytes) -> Any:
+        """Decode a JSON body, keeping only the projected fields of the path."""
+        data = json_loads(body)
+        if (spec := _PROJECTIONS.get(path)) is not None:
+            return project(data, spec)
+        return data
+
+    async def _command(
+        self, path: str, patch: CommandPatch | None = None, **kwargs
+    ) -> None:
+        """Send a command and notify the command listeners.
+
+        patch declares the key paths the command changes, so listeners can
+        update their data without fetching it again.
+        """
+        await self._request("POST", path, **kwargs)
+        # State read before the command is outdated now.
+        self._fresh_gets.clear()
+        for listener in list(self._command_listeners):
+            listener(path, patch or {})
+
+    async def _coalesced_command(
+        self, channel: str, path: str, patch: CommandPatch | None = None, **kwargs
+    ) -> bool:
+        """Send a command unless a newer one on the same channel supersedes it.
+
+        Every call waits COMMAND_COALESCE_WINDOW; only the last call of a burst
+        is sent, the others are dropped. Returns whether this call was sent.
+        """
+        token = object()
+        self._latest_commands[channel] = token
+        await asyncio.sleep(COMMAND_COALESCE_WINDOW)
+        if self._latest_commands.get(channel) is not token:
+            LOGGER.debug("Dropping superseded %s command %s", channel, path)
+            return False
+        del self._latest_commands[channel]
+        await self._command(path, patch, **kwargs)
+        return True
 
     async def async_get_device(self) -> dict[str, Any]:
         """Get device status (battery, brightness, etc.)."""
         return await self._request("GET", "/device")
 
     async def async_get_config(self) -> dict[str, Any]:
-        """Get the full app configuration."""
-        return await self._request("GET", "/config")
+        """Get the app configuration.
+
+        Returns an immutable snapshot of the fields the entities use, or the
+        previous snapshot if the configuration did not change.
+        """
+        return await self._request("GET", "/config", conditional=True)
     
-    async def async_display_on(self) -> None:
-        """Turn the display on."""
-        await self._request("POST", "/display/on")
+    async def async_get_state(self) -> dict[str, Any] | None:
+        """Get device status and app configuration in one request.
+
+        Returns None if the panel has no combined endpoint. The first
+        request probes for it and the outcome is kept in state_endpoint.
+        Panels without it may answer the probe with any error status or
+        page, so everything but an auth or connection error counts as
+        unsupported.
+        """
+        if self.state_endpoint is False:
+            return None
+        try:
+            state = await self._request("GET", "/state", conditional=True)
+        except NotSupportedError:
+            return self._no_state_endpoint()
+        except BadResponseError:
+            if self.state_endpoint is None:
+                return self._no_state_endpoint()
+            raise
+        if not isinstance(state, Mapping) or "device" not in state or "config" not in state:
+            if self.state_endpoint is None:
+                return self._no_state_endpoint()
+            raise ApiError("Ungültige Antwort von /state")
+        self.state_endpoint = True
+        return state
+
+    def _no_state_endpoint(self) -> None:
+        """Remember that the panel has no combined endpoint."""
+        LOGGER.debug("%s has no combined state endpoint", self._base_url)
+        self.state_endpoint = False
+
+    async def async_display_on(self) -> bool:
+        """Turn the display on, unless superseded by a later on/off call."""
+        return await self._coalesced_command(
+            "display", "/display/on", {"device": {(DEVICE_KEY_SCREEN_ON,): True}}
+        )
 
-    async def async_display_off(self) -> None:
-        """Turn the display off."""
-        await self._request("POST", "/display/off")
+    async def async_display_off(self) -> bool:
+        """Turn the display off, unless superseded by a later on/off call."""
+        return await self._coalesced_command(
+            "display", "/display/off", {"device": {(DEVICE_KEY_SCREEN_ON,): False}}
+        )
 
-    async def async_set_brightness(self, brightness: int) -> None:
-        """Set display brightness (0-100)."""
-        await self._request("POST", "/display/brightness", params={"value": brightness})
+    async def async_set_brightness(self, brightness: int) -> bool:
+        """Set display brightness (0-100), unless superseded by a later value."""
+        return await self._coalesced_command(
+            "brightness",
+            "/display/brightness",
+            {"config": {("brightness",): brightness}},
+            params={"value": brightness},
+        )
 
     async def async_close_floating(self) -> None:
         """Close the floating window."""
-        await self._request("POST", "/floating/close")
+        await self._command("/floating/close")
 
     async def async_float_tab(self, tab_index: int) -> None:
         """Float a specific tab."""
-        await self._request("POST", f"/tabs/{tab_index}/float")
+        await self._command(f"/tabs/{tab_index}/float")
 
     async def async_reload_tab(self, tab_index: int) -> None:
         """Reload a specific tab."""
-        await self._request("POST", f"/tabs/{tab_index}/reload")
+        await self._command(f"/tabs/{tab_index}/reload")
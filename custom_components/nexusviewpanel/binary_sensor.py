@@ -57,7 +57,7 @@ class NexusConfigBinarySensor(CoordinatorEntity, BinarySensorEntity):
 
     def __init__(self, coordinator, entry, data_key, name, icon, device_class):
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(data_key,))
         self._data_key = data_key
         self._attr_name = name
         self._attr_icon = icon
@@ -85,7 +85,7 @@ class NexusNestedConfigBinarySensor(CoordinatorEntity, BinarySensorEntity):
 
     def __init__(self, coordinator, entry, key1, key2, name, icon, device_class):
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(key1, key2))
         self._key1 = key1
         self._key2 = key2
         self._attr_name = name
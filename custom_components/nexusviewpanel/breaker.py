@@ -0,0 +1,113 @@
+"""Circuit breaker for unreachable NexusViewPanel devices."""
+from collections.abc import Callable
+import random
+import time
+
+from .const import (
+    BREAKER_BASE_BACKOFF,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_JITTER,
+    BREAKER_MAX_BACKOFF,
+    BREAKER_PROBE_TIMEOUT,
+    LOGGER,
+)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stops talking to a panel after repeated connection failures.
+
+    After BREAKER_FAILURE_THRESHOLD consecutive failures the breaker opens
+    and requests fail immediately. Once the backoff has passed, a single
+    request is let through as a probe (half-open). A successful probe closes
+    the breaker, a failed one reopens it with twice the backoff (plus
+    jitter), up to BREAKER_MAX_BACKOFF. A probe that ends without either
+    (e.g. cancelled) is released, and one that has not ended after
+    BREAKER_PROBE_TIMEOUT seconds is replaced by a new probe.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize the breaker."""
+        self._name = name
+        self.state = STATE_CLOSED
+        self._failures = 0
+        self._opened = 0
+        self._retry_at = 0.0
+        self._probe_deadline = 0.0
+        self._listeners: list[Callable[[], None]] = []
+
+    def add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call listener whenever the state changes."""
+        self._listeners.append(listener)
+
+        def remove_listener() -> None:
+            self._listeners.remove(listener)
+
+        return remove_listener
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds until the next probe is allowed."""
+        return max(0.0, self._retry_at - time.monotonic())
+
+    @property
+    def blocked(self) -> bool:
+        """Return whether requests are currently rejected, without probing."""
+        now = time.monotonic()
+        if self.state == STATE_OPEN:
+            return now < self._retry_at
+        if self.state == STATE_HALF_OPEN:
+            return now < self._probe_deadline
+        return False
+
+    def allow_request(self) -> bool:
+        """Return whether a request may be sent now, taking the probe if due."""
+        if self.state == STATE_CLOSED:
+            return True
+        if self.blocked:
+            return False
+        self._probe_deadline = time.monotonic() + BREAKER_PROBE_TIMEOUT
+        self._set_state(STATE_HALF_OPEN)
+        return True
+
+    def release_probe(self) -> None:
+        """Let the next request probe after a probe ended without an outcome."""
+        if self.state == STATE_HALF_OPEN:
+            self._probe_deadline = 0.0
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful request."""
+        self._failures = 0
+        if self.state != STATE_CLOSED:
+            LOGGER.info("%s is reachable again", self._name)
+            self._opened = 0
+            self._set_state(STATE_CLOSED)
+
+    def record_failure(self) -> None:
+        """Count a connection failure and open the breaker if needed."""
+        self._failures += 1
+        if self.state == STATE_CLOSED and self._failures < BREAKER_FAILURE_THRESHOLD:
+            return
+
+        backoff = min(BREAKER_BASE_BACKOFF * 2**self._opened, BREAKER_MAX_BACKOFF)
+        backoff *= random.uniform(1 - BREAKER_JITTER, 1 + BREAKER_JITTER)
+        self._retry_at = time.monotonic() + backoff
+        self._opened += 1
+        if self.state == STATE_CLOSED:
+            LOGGER.warning(
+                "%s is unreachable, pausing requests for %.0f seconds", self._name, backoff
+            )
+        else:
+            LOGGER.debug("%s is still unreachable, next probe in %.0f seconds", self._name, backoff)
+        self._set_state(STATE_OPEN)
+
+    def _set_state(self, state: str) -> None:
+        """Change the state and notify the listeners."""
+        if state == self.state:
+            return
+        self.state = state
+        for listener in list(self._listeners):
+            listener()
@@ -1,11 +1,18 @@
 """Button platform for NexusViewPanel."""
+from collections.abc import Mapping
+from hashlib import sha1
+import re
+from typing import Any
+
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .api import NexusViewPanelApiClient
+from .api import ApiError, NexusViewPanelApiClient
 from .const import (
     DOMAIN, 
     COORDINATOR_CONFIG, 
@@ -13,6 +20,12 @@ from .const import (
     NEXUS_API_CLIENT, 
     LOGGER
 )
+from .coordinator import NexusDataUpdateCoordinator
+
+TAB_ACTIONS = ("reload", "float")
+# Unique IDs of tab buttons keyed on the tab position, before tab keys.
+_INDEX_UNIQUE_ID = re.compile(r".+_(?P<action>reload|float)_tab_(?P<index>\d+)")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -33,53 +46,176 @@ async def async_setup_entry(
     ]
     async_add_entities(static_buttons)
 
-    manager = NexusTabButtonManager(entry, api_client, config_coordinator, async_add_entities)
+    manager = NexusTabButtonManager(
+        hass, entry, api_client, config_coordinator, async_add_entities
+    )
     
     entry.async_on_unload(
-        config_coordinator.async_add_listener(manager.async_update_buttons)
+        config_coordinator.async_add_listener(manager.async_update_buttons, ("tabs",))
+    )
+    # Registered after the tab listener, so it sees the buttons of the
+    # fetched tabs.
+    entry.async_on_unload(
+        config_coordinator.async_add_listener(manager.async_clean_registry)
     )
     
     manager.async_update_buttons()
+    manager.async_clean_registry()
+
+
+def tab_key(tab: Mapping[str, Any]) -> str | None:
+    """Return a stable identity of a tab: its id, else its URL, else its title.
+
+    URLs and titles are hashed to keep unique IDs short.
+    """
+    if (tab_id := tab.get("id")) not in (None, ""):
+        return str(tab_id)
+    for field in ("url", "title"):
+        if value := tab.get(field):
+            return f"{field}_{sha1(str(value).encode()).hexdigest()[:12]}"
+    return None
 
 
 class NexusTabButtonManager:
-    """Manages the creation and removal of dynamic tab buttons."""
+    """Keeps one reload and one float button per tab, keyed on tab identity.
+
+    Buttons follow their tab when tabs are reordered or renamed and are
+    removed with it.
+    """
     
     def __init__(
         self,
+        hass: HomeAssistant,
         entry: ConfigEntry,
         api_client: NexusViewPanelApiClient,
-        coordinator: DataUpdateCoordinator,
+        coordinator: NexusDataUpdateCoordinator,
         async_add_entities: AddEntitiesCallback
     ):
+        self.hass = hass
         self.entry = entry
         self.api_client = api_client
         self.coordinator = coordinator
         self.async_add_entities = async_add_entities
-        self._current_tab_indices = set()
+        # Tab key -> (title, buttons) and tab key -> current index.
+        self._buttons: dict[str, tuple[str, tuple["NexusTabButton", ...]]] = {}
+        self._indices: dict[str, int] = {}
+        self._signature: tuple[tuple[str, str], ...] | None = None
+        self._registry_cleaned = False
+
+    def tab_index(self, key: str) -> int:
+        """Return the current index of a tab."""
+        if (index := self._indices.get(key)) is None:
+            raise ApiError(f"Tab {key} nicht gefunden")
+        return index
 
     @callback
     def async_update_buttons(self) -> None:
-        """Update buttons based on coordinator data."""
+        """Add, rename and remove tab buttons to match the coordinator data."""
         if self.coordinator.data is None:
             return
 
-        tabs_data = self.coordinator.data.get("tabs", [])
-        
-        new_buttons = []
-        for i, tab in enumerate(tabs_data):
-            tab_index = i
-            tab_title = tab.get("title", f"Tab {tab_index}")
-            
-            if tab_index not in self._current_tab_indices:
-                LOGGER.debug(f"Creating new buttons for tab: {tab_title} (Index {tab_index})")
-                new_buttons.append(NexusReloadTabButton(self.api_client, self.entry, tab_index, tab_title))
-                new_buttons.append(NexusFloatTabButton(self.api_client, self.entry, tab_index, tab_title))
-                self._current_tab_indices.add(tab_index)
+        tabs: dict[str, str] = {}
+        for index, tab in enumerate(self.coordinator.data.get("tabs", ())):
+            key = tab_key(tab) or f"index_{index}"
+            # Tabs sharing an identity are told apart by occurrence.
+            occurrence, unique = 1, key
+            while unique in tabs:
+                occurrence += 1
+                unique = f"{key}_{occurrence}"
+            tabs[unique] = tab.get("title") or f"Tab {index}"
+
+        signature = tuple(tabs.items())
+        if signature == self._signature:
+            return
+        if self._signature is None:
+            self._async_migrate_registry(list(tabs))
+        self._signature = signature
+        self._indices = {key: index for index, key in enumerate(tabs)}
+
+        new_buttons: list[NexusTabButton] = []
+        for key, title in tabs.items():
+            if (current := self._buttons.get(key)) is None:
+                LOGGER.debug("Creating buttons for tab %s (%s)", title, key)
+                buttons = (
+                    NexusReloadTabButton(self, self.entry, key, title),
+                    NexusFloatTabButton(self, self.entry, key, title),
+                )
+                new_buttons.extend(buttons)
+                self._buttons[key] = (title, buttons)
+            elif current[0] != title:
+                for button in current[1]:
+                    button.async_set_title(title)
+                self._buttons[key] = (title, current[1])
+
+        if removed := self._buttons.keys() - tabs.keys():
+            entity_registry = er.async_get(self.hass)
+            for key in removed:
+                title, buttons = self._buttons.pop(key)
+                LOGGER.debug("Removing buttons for tab %s (%s)", title, key)
+                for button in buttons:
+                    if button.registry_entry:
+                        entity_registry.async_remove(button.entity_id)
+                    else:
+                        self.hass.async_create_task(button.async_remove())
 
         if new_buttons:
             self.async_add_entities(new_buttons)
 
+    @callback
+    def _async_migrate_registry(self, keys: list[str]) -> None:
+        """Move tab buttons keyed on the tab position (before tab keys).
+
+        Each is moved to the key of the tab now at that position, keeping
+        its entity ID. Runs before the first buttons are added.
+        """
+        entry_id = self.entry.entry_id
+        entity_registry = er.async_get(self.hass)
+        for entity in er.async_entries_for_config_entry(entity_registry, entry_id):
+            if entity.domain != Platform.BUTTON or not (
+                match := _INDEX_UNIQUE_ID.fullmatch(entity.unique_id)
+            ):
+                continue
+            if (index := int(match["index"])) >= len(keys):
+                continue
+            new_unique_id = f"{entry_id}_tab_{keys[index]}_{match['action']}"
+            if not entity_registry.async_get_entity_id(
+                Platform.BUTTON, DOMAIN, new_unique_id
+            ):
+                entity_registry.async_update_entity(
+                    entity.entity_id, new_unique_id=new_unique_id
+                )
+
+    @callback
+    def async_clean_registry(self) -> None:
+        """Remove registered tab buttons of tabs that no longer exist.
+
+        Runs once, after the first successful fetch: tabs restored from a
+        snapshot may be outdated, and pruning by them would drop the
+        registry entries (and customizations) of newer tabs.
+        """
+        if self._registry_cleaned or not self.coordinator.live:
+            return
+        self._registry_cleaned = True
+        entry_id = self.entry.entry_id
+        wanted = {
+            f"{entry_id}_tab_{key}_{action}"
+            for key in self._indices
+            for action in TAB_ACTIONS
+        }
+        entity_registry = er.async_get(self.hass)
+        for entity in er.async_entries_for_config_entry(entity_registry, entry_id):
+            if (
+                entity.domain != Platform.BUTTON
+                or entity.unique_id in wanted
+                or not (
+                    entity.unique_id.startswith(f"{entry_id}_tab_")
+                    or _INDEX_UNIQUE_ID.fullmatch(entity.unique_id)
+                )
+            ):
+                continue
+            LOGGER.debug("Removing stale tab button %s", entity.entity_id)
+            entity_registry.async_remove(entity.entity_id)
+
 
 class NexusBaseButton(ButtonEntity):
     """Base class for Nexus buttons."""
@@ -109,36 +245,47 @@ class NexusCloseFloatButton(NexusBaseButton):
         await self._api_client.async_close_floating()
 
 
-class NexusReloadTabButton(NexusBaseButton):
-    """Button to reload a specific tab."""
-    _attr_icon = "mdi:reload"
+class NexusTabButton(NexusBaseButton):
+    """Base class for buttons acting on one tab."""
+    _action: str
 
-    def __init__(self, api_client: NexusViewPanelApiClient, entry: ConfigEntry, tab_index: int, tab_title: str):
+    def __init__(self, manager: NexusTabButtonManager, entry: ConfigEntry, tab_key: str, tab_title: str):
         super().__init__(entry)
-        self._api_client = api_client
-        self._tab_index = tab_index
-        self._attr_name = f"Reload {tab_title}"
-        self._attr_unique_id = f"{entry.entry_id}_reload_tab_{tab_index}"
+        self._manager = manager
+        self._tab_key = tab_key
+        self._attr_name = f"{self._action.capitalize()} {tab_title}"
+        self._attr_unique_id = f"{entry.entry_id}_tab_{tab_key}_{self._action}"
+
+    @callback
+    def async_set_title(self, tab_title: str) -> None:
+        """Follow a renamed tab."""
+        self._attr_name = f"{self._action.capitalize()} {tab_title}"
+        if self.hass:
+            self.async_write_ha_state()
+
+
+class NexusReloadTabButton(NexusTabButton):
+    """Button to reload a specific tab."""
+    _attr_icon = "mdi:reload"
+    _action = "reload"
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        await self._api_client.async_reload_tab(self._tab_index)
+        await self._manager.api_client.async_reload_tab(
+            self._manager.tab_index(self._tab_key)
+        )
 
 
-class NexusFloatTabButton(NexusBaseButton):
+class NexusFloatTabButton(NexusTabButton):
     """Button to float a specific tab."""
     _attr_icon = "mdi:picture-in-picture-top-right"
-
-    def __init__(self, api_client: NexusViewPanelApiClient, entry: ConfigEntry, tab_index: int, tab_title: str):
-        super().__init__(entry)
-        self._api_client = api_client
-        self._tab_index = tab_index
-        self._attr_name = f"Float {tab_title}"
-        self._attr_unique_id = f"{entry.entry_id}_float_tab_{tab_index}"
+    _action = "float"
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        await self._api_client.async_float_tab(self._tab_index)
+        await self._manager.api_client.async_float_tab(
+            self._manager.tab_index(self._tab_key)
+        )
 
 
 class NexusGetDeviceInfoButton(NexusBaseButton):
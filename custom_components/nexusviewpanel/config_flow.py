@@ -1,21 +1,44 @@
 """Config flow for NexusViewPanel integration."""
+from ipaddress import IPv4Network, ip_network
 import json
 import os
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
 import voluptuous as vol
-from homeassistant.config_entries import ConfigFlow
+from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
 from homeassistant.const import CONF_API_TOKEN, CONF_HOST, CONF_PORT
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import AbortFlow
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import NexusViewPanelApiClient, ApiError, AuthError
+from .discovery import async_discover_panels
 from .const import (
     DOMAIN, 
     LOGGER, 
     DEVICE_UPDATE_INTERVAL,
-    CONFIG_UPDATE_INTERVAL
+    CONFIG_UPDATE_INTERVAL,
+    BATTERY_DEADBAND,
+    BATTERY_MIN_INTERVAL,
+    BRIGHTNESS_DEADBAND,
+    BRIGHTNESS_MIN_INTERVAL,
+    CONF_BATTERY_DEADBAND,
+    CONF_BATTERY_MIN_INTERVAL,
+    CONF_BRIGHTNESS_DEADBAND,
+    CONF_BRIGHTNESS_MIN_INTERVAL,
+    CONF_CONFIG_INTERVAL,
+    CONF_CONNECT_TIMEOUT,
+    CONF_DEVICE_INTERVAL,
+    CONF_HEDGED_READS,
+    CONF_METRICS,
+    CONF_MAX_CONCURRENT,
+    CONF_READ_TIMEOUT,
+    DISCOVERY_MAX_PROBES,
+    POOL_LIMIT_PER_HOST,
+    REQUEST_CONNECT_TIMEOUT,
+    REQUEST_MAX_CONCURRENT,
+    REQUEST_READ_TIMEOUT,
 )
 
 MANUAL_DATA_SCHEMA = vol.Schema(
@@ -28,6 +51,40 @@ MANUAL_DATA_SCHEMA = vol.Schema(
 
 QR_DATA_SCHEMA = vol.Schema({vol.Required("qr_string"): str})
 
+DISCOVER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required("network"): str,
+        vol.Required("ports", default="8080"): str,
+    }
+)
+
+DEFAULT_OPTIONS: dict[str, Any] = {
+    CONF_DEVICE_INTERVAL: DEVICE_UPDATE_INTERVAL,
+    CONF_CONFIG_INTERVAL: CONFIG_UPDATE_INTERVAL,
+    CONF_CONNECT_TIMEOUT: REQUEST_CONNECT_TIMEOUT,
+    CONF_READ_TIMEOUT: REQUEST_READ_TIMEOUT,
+    CONF_MAX_CONCURRENT: REQUEST_MAX_CONCURRENT,
+    CONF_METRICS: True,
+    CONF_HEDGED_READS: False,
+    CONF_BATTERY_DEADBAND: BATTERY_DEADBAND,
+    CONF_BATTERY_MIN_INTERVAL: BATTERY_MIN_INTERVAL,
+    CONF_BRIGHTNESS_DEADBAND: BRIGHTNESS_DEADBAND,
+    CONF_BRIGHTNESS_MIN_INTERVAL: BRIGHTNESS_MIN_INTERVAL,
+}
+
+
+def get_entry_options(entry: ConfigEntry) -> dict[str, Any]:
+    """Return the tuning options of an entry, with defaults filled in.
+
+    Entries created before the options flow keep their intervals in data.
+    """
+    options = dict(DEFAULT_OPTIONS)
+    for key in (CONF_DEVICE_INTERVAL, CONF_CONFIG_INTERVAL):
+        if key in entry.data:
+            options[key] = entry.data[key]
+    options.update(entry.options)
+    return options
+
 
 class NexusConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for NexusViewPanel."""
@@ -35,6 +92,13 @@ class NexusConfigFlow(ConfigFlow, domain=DOMAIN):
     VERSION = 1
     
     config_data: dict[str, Any] = {}
+    discovered: list[str] = []
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Return the options flow."""
+        return NexusOptionsFlow()
 
     async def _async_validate_connection(
         self, host: str, port: int, token: str
@@ -53,7 +117,7 @@ class NexusConfigFlow(ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> dict[str, Any]:
         """Show the setup method menu."""
-        return self.async_show_menu(step_id="user", menu_options=["qr", "manual"])
+        return self.async_show_menu(step_id="user", menu_options=["qr", "manual", "discover"])
 
     async def async_step_qr(
         self, user_input: dict[str, Any] | None = None
@@ -78,11 +142,12 @@ class NexusConfigFlow(ConfigFlow, domain=DOMAIN):
                 port = parsed_url.port
                 token = query_params["api_token"][0]
 
-                await self._async_validate_connection(host, port, token)
-
+                # Abort before any network I/O if the panel is already set up.
                 await self.async_set_unique_id(f"nexus_{host}")
                 self._abort_if_unique_id_configured()
 
+                await self._async_validate_connection(host, port, token)
+
                 self.config_data = {
                     CONF_HOST: host,
                     CONF_PORT: port,
@@ -119,11 +184,12 @@ class NexusConfigFlow(ConfigFlow, domain=DOMAIN):
             token = user_input[CONF_API_TOKEN]
 
             try:
-                await self._async_validate_connection(host, port, token)
-
+                # Abort before any network I/O if the panel is already set up.
                 await self.async_set_unique_id(f"nexus_{host}")
                 self._abort_if_unique_id_configured()
 
+                await self._async_validate_connection(host, port, token)
+
                 self.config_data = {
                     CONF_HOST: host,
                     CONF_PORT: port,
@@ -146,6 +212,102 @@ class NexusConfigFlow(ConfigFlow, domain=DOMAIN):
             step_id="manual", data_schema=MANUAL_DATA_SCHEMA, errors=errors
         )
 
+    async def async_step_discover(
+        self, user_input: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Search a network range for panels that are not set up yet."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            try:
+                network = ip_network(user_input["network"].strip(), strict=False)
+                if not isinstance(network, IPv4Network):
+                    raise ValueError("Only IPv4 networks are supported")
+            except ValueError:
+                errors["network"] = "invalid_network"
+            try:
+                ports = sorted(
+                    {int(port) for port in user_input["ports"].split(",") if port.strip()}
+                )
+                if not ports or not all(0 < port < 65536 for port in ports):
+                    raise ValueError("Port out of range")
+            except ValueError:
+                errors["ports"] = "invalid_port"
+
+            if not errors and network.num_addresses * len(ports) > DISCOVERY_MAX_PROBES:
+                errors["network"] = "network_too_large"
+
+            if not errors:
+                configured = self._async_current_ids()
+                hosts = [
+                    str(host)
+                    for host in network.hosts()
+                    if f"nexus_{host}" not in configured
+                ]
+                panels = await async_discover_panels(
+                    async_get_clientsession(self.hass), hosts, ports
+                )
+                if panels:
+                    self.discovered = [f"{host}:{port}" for host, port in panels]
+                    return await self.async_step_discover_select()
+                errors["base"] = "no_panels_found"
+
+        return self.async_show_form(
+            step_id="discover",
+            data_schema=self.add_suggested_values_to_schema(
+                DISCOVER_DATA_SCHEMA, user_input
+            ),
+            errors=errors,
+        )
+
+    async def async_step_discover_select(
+        self, user_input: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Pick one of the discovered panels and enter its token."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            host, _, port = user_input["panel"].rpartition(":")
+            token = user_input[CONF_API_TOKEN]
+
+            try:
+                await self.async_set_unique_id(f"nexus_{host}")
+                self._abort_if_unique_id_configured()
+
+                await self._async_validate_connection(host, int(port), token)
+
+                self.config_data = {
+                    CONF_HOST: host,
+                    CONF_PORT: int(port),
+                    CONF_API_TOKEN: token,
+                }
+
+                return await self.async_step_name()
+
+            except AuthError:
+                errors["base"] = "invalid_auth"
+            except ApiError:
+                errors["base"] = "cannot_connect"
+            except AbortFlow as e:
+                return self.async_abort(reason=e.reason)
+            except Exception as e:
+                LOGGER.error(f"Unexpected error during discovery setup: {e}", exc_info=True)
+                errors["base"] = "unknown"
+
+        select_schema = vol.Schema(
+            {
+                vol.Required("panel"): vol.In(self.discovered),
+                vol.Required(CONF_API_TOKEN): str,
+            }
+        )
+
+        return self.async_show_form(
+            step_id="discover_select",
+            data_schema=select_schema,
+            description_placeholders={"count": str(len(self.discovered))},
+            errors=errors,
+        )
+
     async def async_step_name(
         self, user_input: dict[str, Any] | None = None
     ) -> dict[str, Any]:
@@ -157,10 +319,14 @@ class NexusConfigFlow(ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             title = user_input["name"]
             
-            self.config_data["device_interval"] = user_input["device_interval"]
-            self.config_data["config_interval"] = user_input["config_interval"]
-            
-            return self.async_create_entry(title=title, data=self.config_data)
+            return self.async_create_entry(
+                title=title,
+                data=self.config_data,
+                options={
+                    CONF_DEVICE_INTERVAL: user_input[CONF_DEVICE_INTERVAL],
+                    CONF_CONFIG_INTERVAL: user_input[CONF_CONFIG_INTERVAL],
+                },
+            )
         
         default_name = f"Nexus Panel ({self.config_data[CONF_HOST]})"
         
@@ -168,10 +334,10 @@ class NexusConfigFlow(ConfigFlow, domain=DOMAIN):
             {
                 vol.Required("name", default=default_name): str,
                 vol.Required(
-                    "device_interval", default=DEVICE_UPDATE_INTERVAL
+                    CONF_DEVICE_INTERVAL, default=DEVICE_UPDATE_INTERVAL
                 ): vol.All(vol.Coerce(int), vol.Range(min=5)),
                 vol.Required(
-                    "config_interval", default=CONFIG_UPDATE_INTERVAL
+                    CONF_CONFIG_INTERVAL, default=CONFIG_UPDATE_INTERVAL
                 ): vol.All(vol.Coerce(int), vol.Range(min=60)),
             }
         )
@@ -179,3 +345,57 @@ class NexusConfigFlow(ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="name", data_schema=name_schema
         )
+
+
+class NexusOptionsFlow(OptionsFlow):
+    """Tune polling and requests of a panel; applied without a reload."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        options = get_entry_options(self.config_entry)
+        options_schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_DEVICE_INTERVAL, default=options[CONF_DEVICE_INTERVAL]
+                ): vol.All(vol.Coerce(int), vol.Range(min=5)),
+                vol.Required(
+                    CONF_CONFIG_INTERVAL, default=options[CONF_CONFIG_INTERVAL]
+                ): vol.All(vol.Coerce(int), vol.Range(min=60)),
+                vol.Required(
+                    CONF_CONNECT_TIMEOUT, default=options[CONF_CONNECT_TIMEOUT]
+                ): vol.All(vol.Coerce(float), vol.Range(min=1, max=30)),
+                vol.Required(
+                    CONF_READ_TIMEOUT, default=options[CONF_READ_TIMEOUT]
+                ): vol.All(vol.Coerce(float), vol.Range(min=1, max=120)),
+                vol.Required(
+                    CONF_MAX_CONCURRENT, default=options[CONF_MAX_CONCURRENT]
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=POOL_LIMIT_PER_HOST)),
+                vol.Required(
+                    CONF_METRICS, default=options[CONF_METRICS]
+                ): bool,
+                vol.Required(
+                    CONF_HEDGED_READS, default=options[CONF_HEDGED_READS]
+                ): bool,
+                vol.Required(
+                    CONF_BATTERY_DEADBAND, default=options[CONF_BATTERY_DEADBAND]
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=50)),
+                vol.Required(
+                    CONF_BATTERY_MIN_INTERVAL,
+                    default=options[CONF_BATTERY_MIN_INTERVAL],
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                vol.Required(
+                    CONF_BRIGHTNESS_DEADBAND, default=options[CONF_BRIGHTNESS_DEADBAND]
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=50)),
+                vol.Required(
+                    CONF_BRIGHTNESS_MIN_INTERVAL,
+                    default=options[CONF_BRIGHTNESS_MIN_INTERVAL],
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+            }
+        )
+
+        return self.async_show_form(step_id="init", data_schema=options_schema)
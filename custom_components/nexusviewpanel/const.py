@@ -7,6 +7,104 @@ LOGGER = getLogger(__package__)
 DEVICE_UPDATE_INTERVAL = 60
 CONFIG_UPDATE_INTERVAL = 300
 
+CONF_DEVICE_INTERVAL = "device_interval"
+CONF_CONFIG_INTERVAL = "config_interval"
+CONF_CONNECT_TIMEOUT = "connect_timeout"
+CONF_READ_TIMEOUT = "read_timeout"
+CONF_MAX_CONCURRENT = "max_concurrent"
+CONF_HEDGED_READS = "hedged_reads"
+CONF_METRICS = "request_metrics"
+CONF_BATTERY_DEADBAND = "battery_deadband"
+CONF_BATTERY_MIN_INTERVAL = "battery_min_interval"
+CONF_BRIGHTNESS_DEADBAND = "brightness_deadband"
+CONF_BRIGHTNESS_MIN_INTERVAL = "brightness_min_interval"
+
 COORDINATOR_DEVICE = "device_coordinator"
 COORDINATOR_CONFIG = "config_coordinator"
 NEXUS_API_CLIENT = "api_client"
+VALUE_FILTERS = "value_filters"
+
+POLL_SCHEDULER = "poll_scheduler"
+POLL_TICK_INTERVAL = 1
+POLL_MAX_CONCURRENT = 8
+
+PUSH_RECEIVER = "push_receiver"
+PUSH_VIEW_REGISTERED = "push_view_registered"
+PUSH_HEARTBEAT_INTERVAL = 900
+PUSH_STALE_AFTER = 1800
+
+POLL_POLICY = "poll_policy"
+ADAPTIVE_FAST_INTERVAL = 5
+ADAPTIVE_BACKOFF_FACTOR = 2
+ADAPTIVE_IDLE_MAX_FACTOR = 4
+ADAPTIVE_LOW_BATTERY = 20
+
+# Significant-change filtering; a charging battery flaps by 1 %.
+BATTERY_DEADBAND = 2
+BATTERY_MIN_INTERVAL = 300
+BRIGHTNESS_DEADBAND = 2
+BRIGHTNESS_MIN_INTERVAL = 60
+
+DEVICE_KEY_BATTERY = "batteryLevel"
+DEVICE_KEY_SCREEN_ON = "screenOn"
+
+COMMAND_COALESCE_WINDOW = 0.3
+
+PRIORITY_COMMAND = 0
+PRIORITY_REFRESH = 1
+PRIORITY_POLL = 2
+
+GET_FRESHNESS_WINDOW = 0.5
+
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_BASE_BACKOFF = 15
+BREAKER_MAX_BACKOFF = 600
+BREAKER_JITTER = 0.2
+BREAKER_PROBE_TIMEOUT = 300
+
+PANEL_SESSION = "panel_session"
+PANEL_RESOLVER = "panel_resolver"
+POOL_LIMIT_PER_HOST = 2
+POOL_KEEPALIVE_TIMEOUT = 75
+POOL_DNS_CACHE_TTL = 300
+REQUEST_CONNECT_TIMEOUT = 3
+REQUEST_READ_TIMEOUT = 10
+REQUEST_MAX_CONCURRENT = 1
+REQUEST_TIMEOUT_FLOOR = 0.5
+HEDGE_MIN_SAMPLES = 20
+
+TRACE_BUFFER_SIZE = 100
+TRACE_BODY_LIMIT = 512
+# Responses carrying the panel configuration (PINs, credentials in URLs) are
+# traced without their body.
+TRACE_BODYLESS_PATHS = frozenset({"/config", "/state"})
+
+SERVICE_SET_TRACING = "set_tracing"
+SERVICE_DISPLAY_ON = "display_on"
+SERVICE_DISPLAY_OFF = "display_off"
+SERVICE_SET_BRIGHTNESS = "set_brightness"
+SERVICE_RELOAD_TAB = "reload_tab"
+SERVICE_FLOAT_TAB = "float_tab"
+SERVICE_CLOSE_FLOATING = "close_floating"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_AREA_ID = "area_id"
+ATTR_ENABLED = "enabled"
+ATTR_BRIGHTNESS = "brightness"
+ATTR_TAB_INDEX = "tab_index"
+ATTR_TAB_TITLE = "tab_title"
+ATTR_MAX_CONCURRENT = "max_concurrent"
+ATTR_TIMEOUT = "timeout"
+
+BULK_MAX_CONCURRENT = 10
+BULK_TIMEOUT = 15
+
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 300
+SNAPSHOT_MAX_AGE = 7 * 24 * 3600
+
+DISPLAY_CONFIRM_DELAY = 2
+
+DISCOVERY_MAX_CONCURRENT = 64
+DISCOVERY_CONNECT_TIMEOUT = 1
+DISCOVERY_TIMEOUT = 2
+DISCOVERY_MAX_PROBES = 1024
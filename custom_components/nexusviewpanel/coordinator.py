@@ -0,0 +1,108 @@
+"""Data update coordinator for NexusViewPanel."""
+from collections.abc import Hashable, Mapping
+from types import MappingProxyType
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .projection import freeze
+
+_MISSING = object()
+
+
+def get_path(data: Any, path: tuple[Hashable, ...]) -> Any:
+    """Return the value at a key path, or a sentinel if it does not exist."""
+    for key in path:
+        try:
+            data = data[key]
+        except (KeyError, IndexError, TypeError):
+            return _MISSING
+    return data
+
+
+def patch_data(data: Any, path: tuple[str, ...], value: Any) -> Any:
+    """Return a copy of data with the value at a key path replaced.
+
+    Frozen (projected) data stays frozen; missing objects on the path are
+    created.
+    """
+    frozen = isinstance(data, MappingProxyType)
+    patched = dict(data) if isinstance(data, Mapping) else {}
+    key, rest = path[0], path[1:]
+    patched[key] = patch_data(patched.get(key), rest, value) if rest else value
+    return MappingProxyType(patched) if frozen else patched
+
+
+class NexusDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Coordinator that only notifies listeners whose data actually changed.
+
+    Listeners registered with a key path as context, e.g. ("brightness",) or
+    ("floatingView", "enabled"), are only called when the value at that path
+    differs from the snapshot they were last notified with. Listeners without
+    a context and availability changes still reach everyone.
+
+    The coordinator starts unavailable, so entities can be added before the
+    first refresh has finished.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the coordinator."""
+        super().__init__(*args, **kwargs)
+        self.last_update_success = False
+        self._dispatched_data: dict[str, Any] | None = None
+        self._dispatched_success = self.last_update_success
+        # True while listeners are notified of a patch set by a command.
+        self.patching = False
+        # False while the data only comes from a restored snapshot.
+        self.live = False
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data, marking it as live before listeners are notified."""
+        data = await super()._async_update_data()
+        self.live = True
+        return data
+
+    async def _async_refresh(self, *args: Any, **kwargs: Any) -> None:
+        """Refresh, notifying listeners of the first live data in any case.
+
+        With always_update=False, live data equal to the restored snapshot
+        would not reach listeners waiting for live data.
+        """
+        was_live = self.live
+        await super()._async_refresh(*args, **kwargs)
+        if self.live and not was_live:
+            self.async_update_listeners()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners subscribed to changed key paths."""
+        previous = self._dispatched_data
+        self._dispatched_data = self.data
+        availability_changed = self._dispatched_success != self.last_update_success
+        self._dispatched_success = self.last_update_success
+
+        for update_callback, path in list(self._listeners.values()):
+            if (
+                availability_changed
+                or path is None
+                or get_path(previous, path) != get_path(self.data, path)
+            ):
+                update_callback()
+
+    @callback
+    def async_patch(self, changes: Mapping[tuple[str, ...], Any]) -> None:
+        """Apply known changes (key path -> value) without fetching.
+
+        The next scheduled poll verifies them.
+        """
+        if self.data is None or not changes:
+            return
+        data = self.data
+        for path, value in changes.items():
+            data = patch_data(data, path, freeze(value))
+        self.patching = True
+        try:
+            self.async_set_updated_data(data)
+        finally:
+            self.patching = False
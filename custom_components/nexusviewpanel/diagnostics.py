@@ -0,0 +1,42 @@
+"""Diagnostics support for NexusViewPanel."""
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_API_TOKEN
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DOMAIN,
+    COORDINATOR_CONFIG,
+    COORDINATOR_DEVICE,
+    NEXUS_API_CLIENT,
+    POLL_POLICY,
+)
+from .projection import thaw
+
+# Tab URLs may carry credentials (user:password@ or tokens in the query).
+TO_REDACT = {CONF_API_TOKEN, "pin", "url"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data = hass.data[DOMAIN][entry.entry_id]
+    api_client = data[NEXUS_API_CLIENT]
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "connection_state": api_client.breaker.state,
+        "poll_intervals": dict(data[POLL_POLICY].intervals),
+        "request_metrics": (
+            api_client.metrics.as_dict() if api_client.metrics is not None else None
+        ),
+        "request_trace": api_client.trace.as_list(),
+        "round_trip_time": {
+            path: rtt.as_dict() for path, rtt in api_client.rtt.items()
+        },
+        "state_endpoint": api_client.state_endpoint,
+        "device": thaw(data[COORDINATOR_DEVICE].data),
+        "config": async_redact_data(thaw(data[COORDINATOR_CONFIG].data or {}), TO_REDACT),
+    }
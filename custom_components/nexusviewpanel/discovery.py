@@ -0,0 +1,51 @@
+"""Discovery of NexusViewPanel panels in a network range."""
+import asyncio
+from collections.abc import Iterable
+
+from aiohttp import ClientError, ClientSession, ClientTimeout
+
+from .const import (
+    DISCOVERY_CONNECT_TIMEOUT,
+    DISCOVERY_MAX_CONCURRENT,
+    DISCOVERY_TIMEOUT,
+    LOGGER,
+)
+
+
+async def async_discover_panels(
+    session: ClientSession,
+    hosts: Iterable[str],
+    ports: Iterable[int],
+    max_concurrent: int = DISCOVERY_MAX_CONCURRENT,
+    connect_timeout: float = DISCOVERY_CONNECT_TIMEOUT,
+    timeout: float = DISCOVERY_TIMEOUT,
+) -> list[tuple[str, int]]:
+    """Return the (host, port) pairs that answer like a NexusViewPanel API.
+
+    Probes without a token: the panel API answers /api/device with JSON,
+    an authentication error without a valid token. Hosts that don't accept
+    the connection within connect_timeout are skipped.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    client_timeout = ClientTimeout(total=timeout, sock_connect=connect_timeout)
+
+    async def probe(host: str, port: int) -> bool:
+        async with semaphore:
+            try:
+                async with session.get(
+                    f"http://{host}:{port}/api/device",
+                    timeout=client_timeout,
+                    allow_redirects=False,
+                ) as response:
+                    return (
+                        response.status in (200, 401, 403)
+                        and response.content_type == "application/json"
+                    )
+            except (ClientError, TimeoutError):
+                return False
+
+    candidates = [(host, port) for host in hosts for port in ports]
+    found = await asyncio.gather(*(probe(host, port) for host, port in candidates))
+    panels = [candidate for candidate, ok in zip(candidates, found) if ok]
+    LOGGER.debug("Discovery probed %d addresses, found %s", len(candidates), panels)
+    return panels
@@ -0,0 +1,121 @@
+"""Significant-change filtering of numeric entity states."""
+from datetime import datetime
+import math
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import NexusDataUpdateCoordinator
+
+
+class SignificantChangeFilter:
+    """Decides whether a new value of one entity is worth a state write.
+
+    Changes smaller than deadband (from the last written value) are dropped;
+    larger ones are written at most once every min_interval seconds.
+    """
+
+    def __init__(self, deadband: float = 0, min_interval: float = 0) -> None:
+        """Initialize the filter."""
+        self.deadband = deadband
+        self.min_interval = min_interval
+        self._value: Any = None
+        self._time = -math.inf
+
+    def delay(self, value: Any, now: float) -> float | None:
+        """Return the seconds until value may be written, None to drop it."""
+        if not isinstance(value, (int, float)) or not isinstance(
+            self._value, (int, float)
+        ):
+            return 0 if value != self._value else None
+        if abs(value - self._value) < self.deadband:
+            return None
+        return max(0, self._time + self.min_interval - now)
+
+    def accept(self, value: Any, now: float) -> None:
+        """Remember a written value."""
+        self._value = value
+        self._time = now
+
+
+class FilteredCoordinatorEntity(CoordinatorEntity):
+    """Coordinator entity showing one key, written only on significant changes.
+
+    Availability changes and values set by commands are always written.
+    """
+
+    def __init__(
+        self,
+        coordinator: NexusDataUpdateCoordinator,
+        key: str,
+        value_filter: SignificantChangeFilter,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator, context=(key,))
+        self._key = key
+        self._filter = value_filter
+        self._value: Any = None
+        self._written_available: bool | None = None
+        self._unsub_delayed: CALLBACK_TYPE | None = None
+
+    @property
+    def _raw_value(self) -> Any:
+        """Return the value in the coordinator data."""
+        if self.coordinator.data:
+            return self.coordinator.data.get(self._key)
+        return None
+
+    async def async_added_to_hass(self) -> None:
+        """Start from the current value."""
+        await super().async_added_to_hass()
+        self._value = self._raw_value
+        self._filter.accept(self._value, self.hass.loop.time())
+        self._written_available = self.available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state if the value changed significantly."""
+        if (
+            self.coordinator.patching
+            or self.available != self._written_available
+        ):
+            self._async_write_value()
+            return
+        delay = self._filter.delay(self._raw_value, self.hass.loop.time())
+        if delay is None:
+            self._async_cancel_delayed()
+        elif delay == 0:
+            self._async_write_value()
+        elif self._unsub_delayed is None:
+            self._unsub_delayed = async_call_later(
+                self.hass, delay, self._async_write_delayed
+            )
+
+    @callback
+    def _async_write_delayed(self, _now: datetime) -> None:
+        """Write a change held back by the minimum interval."""
+        self._unsub_delayed = None
+        self._handle_coordinator_update()
+
+    @callback
+    def _async_write_value(self) -> None:
+        """Show the current value."""
+        self._async_cancel_delayed()
+        self._value = self._raw_value
+        self._filter.accept(self._value, self.hass.loop.time())
+        self._written_available = self.available
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_delayed(self) -> None:
+        """Cancel a pending delayed write."""
+        if self._unsub_delayed:
+            self._unsub_delayed()
+            self._unsub_delayed = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending delayed write."""
+        self._async_cancel_delayed()
+        await super().async_will_remove_from_hass()
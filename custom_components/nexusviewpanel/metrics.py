@@ -0,0 +1,182 @@
+"""Request metrics for NexusViewPanel API clients."""
+from bisect import bisect_left
+import re
+import time
+from typing import Any
+
+# Upper bounds of the latency histogram buckets in seconds; the last bucket
+# counts everything slower.
+LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_TAB_PATH = re.compile(r"/tabs/\d+/")
+
+# Gains of the smoothed RTT and its variation, as in TCP (RFC 6298).
+RTT_ALPHA = 1 / 8
+RTT_BETA = 1 / 4
+RTT_MAX_BACKOFF = 64
+
+
+class EndpointMetrics:
+    """Fixed-size counters of one endpoint."""
+
+    __slots__ = (
+        "buckets",
+        "requests",
+        "latency_sum",
+        "timeouts",
+        "connection_errors",
+        "auth_errors",
+        "http_errors",
+        "bytes_received",
+        "last_success",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.requests = 0
+        self.latency_sum = 0.0
+        self.timeouts = 0
+        self.connection_errors = 0
+        self.auth_errors = 0
+        self.http_errors = 0
+        self.bytes_received = 0
+        self.last_success: float | None = None
+
+    @property
+    def errors(self) -> int:
+        """Return the number of failed requests."""
+        return self.timeouts + self.connection_errors + self.auth_errors + self.http_errors
+
+    def observe(self, latency: float, size: int) -> None:
+        """Record a successful request."""
+        self.buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        self.requests += 1
+        self.latency_sum += latency
+        self.bytes_received += size
+        self.last_success = time.time()
+
+    def percentile(self, pct: float) -> float | None:
+        """Return the upper bound of the bucket holding the pct percentile.
+
+        Latencies beyond the last bucket are reported as its bound.
+        """
+        if not self.requests:
+            return None
+        rank = pct * self.requests
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.buckets):
+            seen += count
+            if seen >= rank:
+                return bound
+        return LATENCY_BUCKETS[-1]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for diagnostics."""
+        return {
+            "requests": self.requests,
+            "latency_avg": self.latency_sum / self.requests if self.requests else None,
+            "latency_p50": self.percentile(0.5),
+            "latency_p95": self.percentile(0.95),
+            "latency_buckets": dict(
+                zip([*map(str, LATENCY_BUCKETS), "+Inf"], self.buckets)
+            ),
+            "timeouts": self.timeouts,
+            "connection_errors": self.connection_errors,
+            "auth_errors": self.auth_errors,
+            "http_errors": self.http_errors,
+            "bytes_received": self.bytes_received,
+            "last_success": self.last_success,
+        }
+
+
+class PanelMetrics:
+    """Request metrics of one panel, keyed by endpoint.
+
+    Tab indices are folded into one endpoint, so the memory used does not
+    grow with the number of tabs or requests.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.endpoints: dict[str, EndpointMetrics] = {}
+
+    def endpoint(self, method: str, path: str) -> EndpointMetrics:
+        """Return the counters of an endpoint."""
+        key = f"{method} {_TAB_PATH.sub('/tabs/{index}/', path)}"
+        if (metrics := self.endpoints.get(key)) is None:
+            metrics = self.endpoints[key] = EndpointMetrics()
+        return metrics
+
+    @property
+    def errors(self) -> int:
+        """Return the number of failed requests of all endpoints."""
+        return sum(metrics.errors for metrics in self.endpoints.values())
+
+    @property
+    def last_success(self) -> float | None:
+        """Return the time of the last successful request."""
+        return max(
+            (m.last_success for m in self.endpoints.values() if m.last_success),
+            default=None,
+        )
+
+    def latency_percentile(self, pct: float) -> float | None:
+        """Return the pct latency percentile of the GET endpoints."""
+        merged = EndpointMetrics()
+        for key, metrics in self.endpoints.items():
+            if key.startswith("GET "):
+                merged.requests += metrics.requests
+                merged.buckets = [a + b for a, b in zip(merged.buckets, metrics.buckets)]
+        return merged.percentile(pct)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all counters for diagnostics."""
+        return {key: metrics.as_dict() for key, metrics in self.endpoints.items()}
+
+
+class RttEstimator:
+    """Smoothed round-trip time of one panel endpoint, estimated as TCP does.
+
+    The request timeout is srtt + 4 * rttvar within floor and ceiling, the
+    ceiling until the first sample. Every timeout doubles it until the next
+    successful request.
+    """
+
+    def __init__(self, floor: float, ceiling: float) -> None:
+        """Initialize the estimator."""
+        self.floor = floor
+        self.ceiling = ceiling
+        self.srtt: float | None = None
+        self.rttvar = 0.0
+        self._backoff = 1
+
+    @property
+    def timeout(self) -> float:
+        """Return the timeout for the next request."""
+        if self.srtt is None:
+            return self.ceiling
+        rto = max(self.floor, self.srtt + 4 * self.rttvar) * self._backoff
+        return min(self.ceiling, rto)
+
+    def sample(self, rtt: float) -> None:
+        """Record the duration of a successful request."""
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar += RTT_BETA * (abs(self.srtt - rtt) - self.rttvar)
+            self.srtt += RTT_ALPHA * (rtt - self.srtt)
+        self._backoff = 1
+
+    def record_timeout(self) -> None:
+        """Back off after a request timed out."""
+        self._backoff = min(self._backoff * 2, RTT_MAX_BACKOFF)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the estimate for diagnostics."""
+        return {
+            "srtt": self.srtt,
+            "rttvar": self.rttvar,
+            "timeout": self.timeout,
+        }
@@ -3,9 +3,9 @@ from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, COORDINATOR_CONFIG, NEXUS_API_CLIENT
+from .const import DOMAIN, COORDINATOR_CONFIG, NEXUS_API_CLIENT, VALUE_FILTERS
+from .filters import FilteredCoordinatorEntity, SignificantChangeFilter
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -20,12 +20,17 @@ async def async_setup_entry(
             coordinator=data[COORDINATOR_CONFIG],
             api_client=data[NEXUS_API_CLIENT],
             entry=entry,
+            value_filter=data[VALUE_FILTERS]["brightness"],
         )
     ])
 
 
-class NexusBrightnessNumber(CoordinatorEntity, NumberEntity):
-    """Represents the brightness setting slider."""
+class NexusBrightnessNumber(FilteredCoordinatorEntity, NumberEntity):
+    """Represents the brightness setting slider.
+
+    Small drifts reported by the panel are filtered; values set by a
+    command are always shown.
+    """
 
     _attr_has_entity_name = True
     _attr_name = "Configured Brightness"
@@ -35,9 +40,15 @@ class NexusBrightnessNumber(CoordinatorEntity, NumberEntity):
     _attr_native_step = 1
     _attr_mode = NumberMode.SLIDER
 
-    def __init__(self, coordinator, api_client, entry: ConfigEntry):
+    def __init__(
+        self,
+        coordinator,
+        api_client,
+        entry: ConfigEntry,
+        value_filter: SignificantChangeFilter,
+    ):
         """Initialize the number entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, "brightness", value_filter)
         self._api_client = api_client
         self._attr_device_info = {
             "identifiers": {(DOMAIN, entry.entry_id)},
@@ -48,12 +59,11 @@ class NexusBrightnessNumber(CoordinatorEntity, NumberEntity):
 
     @property
     def native_value(self) -> float | None:
-        """Return the current brightness setting."""
-        if self.coordinator.data and "brightness" in self.coordinator.data:
-            return self.coordinator.data["brightness"]
-        return None
+        """Return the last significant brightness setting."""
+        return self._value
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the brightness setting."""
+        # Only the last value of a slider drag is sent. The client patches the
+        # coordinator data with it; the next poll verifies it.
         await self._api_client.async_set_brightness(int(value))
-        await self.coordinator.async_request_refresh()
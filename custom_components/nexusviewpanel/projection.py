@@ -0,0 +1,63 @@
+"""Projection of panel responses onto the fields entities read."""
+from types import MappingProxyType
+from typing import Any
+
+# Key paths of /api/config read by the entities. None keeps a value, a dict
+# descends into an object and a one-item list projects every list item.
+# Everything else (custom CSS/JS, other settings) is dropped after parsing.
+CONFIG_PROJECTION: dict[str, Any] = {
+    "brightness": None,
+    "kioskMode": None,
+    "fullscreen": None,
+    "reloadOnTabReselect": None,
+    "reloadOnSwipe": None,
+    "reloadOnWakeup": None,
+    "runOnReboot": None,
+    "deviceAdminLock": None,
+    "tabsSwipable": None,
+    "floatingView": {"enabled": None},
+    "pinProtection": {"enabled": None},
+    "tabs": [{"id": None, "title": None, "url": None}],
+}
+
+
+# Concrete types, much cheaper to check than the abstract Mapping/Sequence.
+_MAPPINGS = (dict, MappingProxyType)
+_SEQUENCES = (list, tuple)
+
+
+def freeze(value: Any) -> Any:
+    """Return an immutable copy of a decoded JSON value."""
+    if isinstance(value, _MAPPINGS):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, _SEQUENCES):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Return a plain dict/list copy of a frozen value, e.g. for JSON."""
+    if isinstance(value, _MAPPINGS):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, _SEQUENCES):
+        return [thaw(item) for item in value]
+    return value
+
+
+def project(data: Any, spec: Any) -> Any:
+    """Return an immutable snapshot of the parts of data named by spec.
+
+    Values whose type does not match the spec are kept as they are, so
+    entities see the same data they would without the projection.
+    """
+    if spec is None:
+        return freeze(data)
+    if isinstance(spec, dict):
+        if isinstance(data, _MAPPINGS):
+            return MappingProxyType(
+                {key: project(data[key], sub) for key, sub in spec.items() if key in data}
+            )
+    elif isinstance(data, _SEQUENCES):
+        item_spec = spec[0]
+        return tuple(project(item, item_spec) for item in data)
+    return freeze(data)
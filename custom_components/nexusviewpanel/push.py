@@ -0,0 +1,212 @@
+"""Push receiver for NexusViewPanel state updates."""
+from collections.abc import Mapping
+from datetime import datetime
+from hmac import compare_digest
+from http import HTTPStatus
+from typing import Any
+
+from aiohttp import web
+import voluptuous as vol
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import (
+    COORDINATOR_CONFIG,
+    COORDINATOR_DEVICE,
+    DEVICE_KEY_BATTERY,
+    DEVICE_KEY_SCREEN_ON,
+    DOMAIN,
+    LOGGER,
+    PUSH_RECEIVER,
+    PUSH_STALE_AFTER,
+    PUSH_VIEW_REGISTERED,
+)
+from .projection import CONFIG_PROJECTION, project
+from .scheduler import AdaptivePollPolicy
+
+# Pushed sections that are reduced to the fields the entities use, like
+# the polled responses.
+_PROJECTIONS: dict[str, Any] = {"config": CONFIG_PROJECTION}
+
+_NUMBER = vol.Any(int, float)
+_TEXT = vol.Any(str, None)
+_ENABLED_SCHEMA = vol.Schema({vol.Optional("enabled"): bool}, extra=vol.ALLOW_EXTRA)
+
+# Pushed deltas are partial, so every key is optional. The keys the entities
+# read (see CONFIG_PROJECTION) must have the types they expect; other keys
+# are accepted and dropped by the projection.
+PUSH_SCHEMA = vol.Schema(
+    {
+        vol.Optional("device"): vol.Schema(
+            {
+                vol.Optional(DEVICE_KEY_BATTERY): _NUMBER,
+                vol.Optional(DEVICE_KEY_SCREEN_ON): bool,
+            },
+            extra=vol.ALLOW_EXTRA,
+        ),
+        vol.Optional("config"): vol.Schema(
+            {
+                vol.Optional("brightness"): _NUMBER,
+                vol.Optional("kioskMode"): bool,
+                vol.Optional("fullscreen"): bool,
+                vol.Optional("reloadOnTabReselect"): bool,
+                vol.Optional("reloadOnSwipe"): bool,
+                vol.Optional("reloadOnWakeup"): bool,
+                vol.Optional("runOnReboot"): bool,
+                vol.Optional("deviceAdminLock"): bool,
+                vol.Optional("tabsSwipable"): bool,
+                vol.Optional("floatingView"): _ENABLED_SCHEMA,
+                vol.Optional("pinProtection"): _ENABLED_SCHEMA,
+                vol.Optional("tabs"): [
+                    vol.Schema(
+                        {
+                            vol.Optional("id"): vol.Any(str, int, None),
+                            vol.Optional("title"): _TEXT,
+                            vol.Optional("url"): _TEXT,
+                        },
+                        extra=vol.ALLOW_EXTRA,
+                    )
+                ],
+            },
+            extra=vol.ALLOW_EXTRA,
+        ),
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+def merge_delta(data: Mapping[str, Any] | None, delta: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of data with the (possibly nested) delta applied."""
+    merged = dict(data or {})
+    for key, value in delta.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), Mapping):
+            merged[key] = merge_delta(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+class NexusPushReceiver:
+    """Feeds pushed deltas of one panel into its coordinators.
+
+    While pushes keep arriving, the poll policy of the panel slows polling
+    down to a heartbeat. If no push is seen for PUSH_STALE_AFTER seconds,
+    regular polling is restored.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        token: str,
+        poll_policy: AdaptivePollPolicy,
+    ) -> None:
+        """Initialize the receiver."""
+        self._hass = hass
+        self._entry_id = entry_id
+        self._token = token
+        self._poll_policy = poll_policy
+        self._unsub_stale: CALLBACK_TYPE | None = None
+        self.healthy = False
+
+    def is_authorized(self, request: web.Request) -> bool:
+        """Check the bearer token of an incoming push."""
+        auth = request.headers.get("Authorization", "")
+        # compare_digest only takes ASCII strings, so compare the bytes.
+        return compare_digest(
+            auth.encode("utf-8", "surrogatepass"),
+            f"Bearer {self._token}".encode(),
+        )
+
+    @callback
+    def async_handle_push(
+        self, coordinators: dict[str, DataUpdateCoordinator], payload: dict[str, Any]
+    ) -> None:
+        """Apply a pushed payload and mark push as healthy."""
+        for section, coordinator in coordinators.items():
+            if isinstance(delta := payload.get(section), dict) and delta:
+                data = merge_delta(coordinator.data, delta)
+                if (spec := _PROJECTIONS.get(section)) is not None:
+                    data = project(data, spec)
+                coordinator.async_set_updated_data(data)
+
+        if not self.healthy:
+            LOGGER.debug("Push active for %s, polling reduced to heartbeat", self._entry_id)
+            self.healthy = True
+            self._poll_policy.async_set_push_active(True)
+
+        if self._unsub_stale:
+            self._unsub_stale()
+        self._unsub_stale = async_call_later(
+            self._hass, PUSH_STALE_AFTER, self._async_push_stale
+        )
+
+    @callback
+    def _async_push_stale(self, _now: datetime) -> None:
+        """Fall back to regular polling after pushes stopped."""
+        self._unsub_stale = None
+        self.healthy = False
+        LOGGER.debug("No push from %s, restoring regular polling", self._entry_id)
+        self._poll_policy.async_set_push_active(False)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the staleness timer."""
+        if self._unsub_stale:
+            self._unsub_stale()
+            self._unsub_stale = None
+
+
+class NexusPushView(HomeAssistantView):
+    """Receives device and config deltas POSTed by panels."""
+
+    url = f"/api/{DOMAIN}/push/{{entry_id}}"
+    name = f"api:{DOMAIN}:push"
+    # Panels authenticate with their own API token, not a HA user token.
+    requires_auth = False
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self._hass = hass
+
+    async def post(self, request: web.Request, entry_id: str) -> web.Response:
+        """Handle a push from a panel."""
+        data = self._hass.data.get(DOMAIN, {}).get(entry_id)
+        if not isinstance(data, dict) or PUSH_RECEIVER not in data:
+            return self.json_message("Unknown panel", HTTPStatus.NOT_FOUND)
+
+        receiver: NexusPushReceiver = data[PUSH_RECEIVER]
+        if not receiver.is_authorized(request):
+            return self.json_message("Unauthorized", HTTPStatus.UNAUTHORIZED)
+
+        try:
+            payload = await request.json()
+        except ValueError:
+            return self.json_message("Invalid JSON", HTTPStatus.BAD_REQUEST)
+        try:
+            payload = PUSH_SCHEMA(payload)
+        except vol.Invalid as err:
+            return self.json_message(
+                f"Invalid payload: {err}", HTTPStatus.BAD_REQUEST
+            )
+
+        receiver.async_handle_push(
+            {
+                "device": data[COORDINATOR_DEVICE],
+                "config": data[COORDINATOR_CONFIG],
+            },
+            payload,
+        )
+        return self.json_message("OK")
+
+
+@callback
+def async_register_push_view(hass: HomeAssistant) -> None:
+    """Register the push view once for the whole integration."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if domain_data.get(PUSH_VIEW_REGISTERED):
+        return
+    hass.http.register_view(NexusPushView(hass))
+    domain_data[PUSH_VIEW_REGISTERED] = True
@@ -0,0 +1,261 @@
+"""Shared poll scheduler for all NexusViewPanel config entries."""
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+import zlib
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .api import request_priority
+from .const import (
+    ADAPTIVE_BACKOFF_FACTOR,
+    ADAPTIVE_FAST_INTERVAL,
+    ADAPTIVE_IDLE_MAX_FACTOR,
+    LOGGER,
+    POLL_MAX_CONCURRENT,
+    POLL_TICK_INTERVAL,
+    PRIORITY_POLL,
+    PUSH_HEARTBEAT_INTERVAL,
+)
+
+
+class _PollJob:
+    """A single periodic refresh owned by the scheduler."""
+
+    def __init__(
+        self, key: str, refresh: Callable[[], Awaitable[None]], interval: float
+    ) -> None:
+        """Initialize the job."""
+        self.key = key
+        self.refresh = refresh
+        self.interval = interval
+        self.next_run = 0.0
+        self.last_run: float | None = None
+        self.running = False
+
+    def phase(self) -> float:
+        """Return the deterministic offset of this job within its interval."""
+        return (zlib.crc32(self.key.encode()) % 1000) / 1000 * self.interval
+
+    def schedule_from(self, now: float) -> None:
+        """Set next_run to the first slot on this job's phase grid after now."""
+        self.next_run = now + (self.phase() - now) % self.interval
+        if self.next_run <= now:
+            self.next_run += self.interval
+
+    def schedule_after_last_run(self, now: float) -> None:
+        """Set next_run one interval after the last run, on the nearest phase slot.
+
+        Keeps the gap between polls close to the interval when it changes,
+        instead of a random part of it. A slot already in the past runs on
+        the next tick.
+        """
+        if self.last_run is None:
+            self.schedule_from(now)
+            return
+        due = self.last_run + self.interval
+        offset = (self.phase() - due) % self.interval
+        if offset > self.interval / 2:
+            offset -= self.interval
+        self.next_run = due + offset
+
+
+class NexusPollScheduler:
+    """Drive every panel's coordinator refresh from a single shared timer.
+
+    Each job gets a fixed phase offset derived from its key, so N panels
+    with the same interval are spread evenly over that interval instead of
+    firing together. The timer ticks at most once per POLL_TICK_INTERVAL
+    and at most POLL_MAX_CONCURRENT refreshes are in flight at once.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_concurrent: int = POLL_MAX_CONCURRENT,
+        tick: float = POLL_TICK_INTERVAL,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._jobs: dict[str, _PollJob] = {}
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._tick = tick
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add_job(
+        self, key: str, refresh: Callable[[], Awaitable[None]], interval: float
+    ) -> CALLBACK_TYPE:
+        """Register a periodic refresh and return a callback to remove it."""
+        job = _PollJob(key, refresh, interval)
+        job.schedule_from(self._hass.loop.time())
+        self._jobs[key] = job
+
+        if self._unsub_timer is None:
+            self._unsub_timer = async_track_time_interval(
+                self._hass,
+                self._async_tick,
+                timedelta(seconds=self._tick),
+                name="NexusViewPanel poll scheduler",
+                cancel_on_shutdown=True,
+            )
+
+        @callback
+        def remove_job() -> None:
+            if self._jobs.get(key) is job:
+                del self._jobs[key]
+            if not self._jobs and self._unsub_timer is not None:
+                self._unsub_timer()
+                self._unsub_timer = None
+
+        return remove_job
+
+    @callback
+    def async_set_interval(self, key: str, interval: float) -> None:
+        """Change the interval of a registered job in place."""
+        if (job := self._jobs.get(key)) is None or job.interval == interval:
+            return
+        job.interval = interval
+        job.schedule_after_last_run(self._hass.loop.time())
+
+    @callback
+    def _async_tick(self, _now: datetime) -> None:
+        """Start every job whose slot has come up since the last tick."""
+        now = self._hass.loop.time()
+        for job in self._jobs.values():
+            if job.next_run > now:
+                continue
+            job.schedule_from(now)
+            if job.running:
+                LOGGER.debug("Skipping poll for %s, previous one still running", job.key)
+                continue
+            job.running = True
+            job.last_run = now
+            self._hass.async_create_background_task(
+                self._async_run(job), f"{job.key} poll"
+            )
+
+    async def _async_run(self, job: _PollJob) -> None:
+        """Run a job once a concurrency slot is free."""
+        # Runs in its own task, so this only affects requests of this job.
+        request_priority.set(PRIORITY_POLL)
+        try:
+            async with self._semaphore:
+                await job.refresh()
+        finally:
+            job.running = False
+
+
+class AdaptivePollPolicy:
+    """Derives the effective poll intervals of one panel from its activity.
+
+    After a command or a detected change a section is polled every
+    ADAPTIVE_FAST_INTERVAL seconds, then the interval grows by
+    ADAPTIVE_BACKOFF_FACTOR with every unchanged poll, up to the configured
+    interval, which is never exceeded in normal operation. While the panel
+    is idle (display off, low battery) or failing, it may grow to
+    ADAPTIVE_IDLE_MAX_FACTOR times the configured interval. While push is
+    healthy, polling never runs faster than PUSH_HEARTBEAT_INTERVAL.
+    """
+
+    def __init__(
+        self,
+        entry_id: str,
+        scheduler: NexusPollScheduler,
+        base_intervals: dict[str, float],
+    ) -> None:
+        """Initialize the policy."""
+        self._entry_id = entry_id
+        self._scheduler = scheduler
+        self._base = dict(base_intervals)
+        self._current = dict(base_intervals)
+        self._idle = False
+        self._push_active = False
+        self.intervals: dict[str, float] = dict(base_intervals)
+        self._listeners: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for changes of the effective intervals."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_set_base_intervals(self, base_intervals: dict[str, float]) -> None:
+        """Switch to new configured intervals, starting over from them."""
+        if base_intervals == self._base:
+            return
+        self._base = dict(base_intervals)
+        self._current = dict(base_intervals)
+        self._async_apply()
+
+    @callback
+    def async_notify_activity(self) -> None:
+        """Poll every section fast, e.g. after a command was sent."""
+        for section, base in self._base.items():
+            self._current[section] = min(base, ADAPTIVE_FAST_INTERVAL)
+        self._async_apply()
+
+    @callback
+    def async_record_poll(self, section: str, changed: bool) -> None:
+        """Speed up after a change, back off while values stay stable."""
+        base = self._base[section]
+        if changed:
+            self._current[section] = min(base, ADAPTIVE_FAST_INTERVAL)
+        else:
+            limit = base * ADAPTIVE_IDLE_MAX_FACTOR if self._idle else base
+            self._current[section] = min(
+                self._current[section] * ADAPTIVE_BACKOFF_FACTOR, limit
+            )
+        self._async_apply()
+
+    @callback
+    def async_record_failure(self, section: str) -> None:
+        """Back off while a section keeps failing."""
+        self._current[section] = min(
+            self._current[section] * ADAPTIVE_BACKOFF_FACTOR,
+            self._base[section] * ADAPTIVE_IDLE_MAX_FACTOR,
+        )
+        self._async_apply()
+
+    @callback
+    def async_set_idle(self, idle: bool) -> None:
+        """Allow slower polling while the panel is idle."""
+        if idle == self._idle:
+            return
+        self._idle = idle
+        if not idle:
+            for section, base in self._base.items():
+                self._current[section] = min(self._current[section], base)
+            self._async_apply()
+
+    @callback
+    def async_set_push_active(self, push_active: bool) -> None:
+        """Reduce polling to a heartbeat while push is healthy."""
+        if push_active == self._push_active:
+            return
+        self._push_active = push_active
+        self._async_apply()
+
+    @callback
+    def _async_apply(self) -> None:
+        """Hand the effective intervals to the scheduler."""
+        intervals = {
+            section: max(current, PUSH_HEARTBEAT_INTERVAL)
+            if self._push_active
+            else current
+            for section, current in self._current.items()
+        }
+        if intervals == self.intervals:
+            return
+        self.intervals = intervals
+        for section, interval in intervals.items():
+            self._scheduler.async_set_interval(f"{self._entry_id}_{section}", interval)
+        for update_callback in list(self._listeners):
+            update_callback()
@@ -1,16 +1,33 @@
 """Sensor platform for NexusViewPanel."""
+from datetime import datetime, timedelta
+
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .api import NexusViewPanelApiClient
+from .breaker import STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN, CircuitBreaker
+from .const import (
+    DOMAIN,
+    COORDINATOR_DEVICE,
+    DEVICE_KEY_BATTERY,
+    NEXUS_API_CLIENT,
+    POLL_POLICY,
+    VALUE_FILTERS,
+)
+from .filters import FilteredCoordinatorEntity, SignificantChangeFilter
+from .metrics import PanelMetrics
+from .scheduler import AdaptivePollPolicy
 
-from .const import DOMAIN, COORDINATOR_DEVICE
+# Only the request metric sensors poll; they read in-memory counters.
+SCAN_INTERVAL = timedelta(seconds=60)
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -21,14 +38,25 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator = data[COORDINATOR_DEVICE]
 
+    poll_policy = data[POLL_POLICY]
+
     sensors = [
-        NexusBatterySensor(coordinator, entry),
+        NexusBatterySensor(coordinator, entry, data[VALUE_FILTERS]["battery"]),
+        NexusPollIntervalSensor(poll_policy, entry, "device", "Device Poll Interval"),
+        NexusPollIntervalSensor(poll_policy, entry, "config", "Config Poll Interval"),
+        NexusConnectionStateSensor(data[NEXUS_API_CLIENT].breaker, entry),
+        NexusRequestLatencySensor(data[NEXUS_API_CLIENT], entry),
+        NexusRequestErrorsSensor(data[NEXUS_API_CLIENT], entry),
+        NexusLastSuccessSensor(data[NEXUS_API_CLIENT], entry),
     ]
     async_add_entities(sensors)
 
 
-class NexusBatterySensor(CoordinatorEntity, SensorEntity):
-    """Represents the device battery sensor."""
+class NexusBatterySensor(FilteredCoordinatorEntity, SensorEntity):
+    """Represents the device battery sensor.
+
+    Flapping by less than the deadband (e.g. while charging) is not written.
+    """
 
     _attr_has_entity_name = True
     _attr_name = "Battery"
@@ -36,9 +64,11 @@ class NexusBatterySensor(CoordinatorEntity, SensorEntity):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = PERCENTAGE
 
-    def __init__(self, coordinator, entry: ConfigEntry):
+    def __init__(
+        self, coordinator, entry: ConfigEntry, value_filter: SignificantChangeFilter
+    ):
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, DEVICE_KEY_BATTERY, value_filter)
         
         self._attr_device_info = {
             "identifiers": {(DOMAIN, entry.entry_id)},
@@ -49,9 +79,167 @@ class NexusBatterySensor(CoordinatorEntity, SensorEntity):
 
     @property
     def native_value(self) -> int | None:
-        """Return the state of the sensor."""
-        key_to_check = "batteryLevel"
-        
-        if self.coordinator.data and key_to_check in self.coordinator.data:
-            return self.coordinator.data[key_to_check]
-        return None
+        """Return the last significant battery level."""
+        return self._value
+
+
+class NexusPollIntervalSensor(SensorEntity):
+    """Diagnostic sensor showing the effective adaptive poll interval."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_icon = "mdi:timer-sync-outline"
+
+    def __init__(
+        self, poll_policy: AdaptivePollPolicy, entry: ConfigEntry, section: str, name: str
+    ):
+        """Initialize the sensor."""
+        self._poll_policy = poll_policy
+        self._section = section
+        self._attr_name = name
+        self._attr_device_info = { "identifiers": {(DOMAIN, entry.entry_id)} }
+        self._attr_unique_id = f"{entry.entry_id}_{section}_poll_interval"
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to interval changes."""
+        self.async_on_remove(
+            self._poll_policy.async_add_listener(self.async_write_ha_state)
+        )
+
+    @property
+    def native_value(self) -> float:
+        """Return the effective poll interval."""
+        return self._poll_policy.intervals[self._section]
+
+
+class NexusConnectionStateSensor(SensorEntity):
+    """Diagnostic sensor showing the circuit breaker state of the panel."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_name = "Connection State"
+    _attr_icon = "mdi:lan-connect"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = [STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN]
+
+    def __init__(self, breaker: CircuitBreaker, entry: ConfigEntry):
+        """Initialize the sensor."""
+        self._breaker = breaker
+        self._attr_device_info = { "identifiers": {(DOMAIN, entry.entry_id)} }
+        self._attr_unique_id = f"{entry.entry_id}_connection_state"
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to breaker state changes."""
+        self.async_on_remove(self._breaker.add_listener(self.async_write_ha_state))
+
+    @property
+    def native_value(self) -> str:
+        """Return the breaker state."""
+        return self._breaker.state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, float]:
+        """Return the time until the next probe."""
+        return {"retry_in": round(self._breaker.retry_in)}
+
+
+class NexusRequestMetricSensor(SensorEntity):
+    """Base class of the diagnostic request metric sensors.
+
+    Unavailable while request metrics are turned off in the options.
+    """
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self, api_client: NexusViewPanelApiClient, entry: ConfigEntry, key: str
+    ):
+        """Initialize the sensor."""
+        self._api_client = api_client
+        self._attr_device_info = { "identifiers": {(DOMAIN, entry.entry_id)} }
+        self._attr_unique_id = f"{entry.entry_id}_{key}"
+
+    @property
+    def _metrics(self) -> PanelMetrics:
+        """Return the metrics of the panel; only read while available."""
+        return self._api_client.metrics
+
+    @property
+    def available(self) -> bool:
+        """Return whether request metrics are being collected."""
+        return self._api_client.metrics is not None
+
+
+class NexusRequestLatencySensor(NexusRequestMetricSensor):
+    """Diagnostic sensor showing the 95th percentile of the GET latency."""
+
+    _attr_name = "Request Latency"
+    _attr_icon = "mdi:timer-outline"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+
+    def __init__(self, api_client: NexusViewPanelApiClient, entry: ConfigEntry):
+        """Initialize the sensor."""
+        super().__init__(api_client, entry, "request_latency")
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the histogram bucket holding the 95th percentile."""
+        return self._metrics.latency_percentile(0.95)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, float | None]:
+        """Return the median latency."""
+        return {"p50": self._metrics.latency_percentile(0.5)}
+
+
+class NexusRequestErrorsSensor(NexusRequestMetricSensor):
+    """Diagnostic sensor counting failed requests."""
+
+    _attr_name = "Request Errors"
+    _attr_icon = "mdi:alert-circle-outline"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, api_client: NexusViewPanelApiClient, entry: ConfigEntry):
+        """Initialize the sensor."""
+        super().__init__(api_client, entry, "request_errors")
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of failed requests since setup."""
+        return self._metrics.errors
+
+    @property
+    def extra_state_attributes(self) -> dict[str, int]:
+        """Return the errors by kind."""
+        endpoints = self._metrics.endpoints.values()
+        return {
+            kind: sum(getattr(metrics, kind) for metrics in endpoints)
+            for kind in ("timeouts", "connection_errors", "auth_errors", "http_errors")
+        }
+
+
+class NexusLastSuccessSensor(NexusRequestMetricSensor):
+    """Diagnostic sensor showing when the panel last answered a request."""
+
+    _attr_name = "Last Successful Request"
+    _attr_icon = "mdi:clock-check-outline"
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    def __init__(self, api_client: NexusViewPanelApiClient, entry: ConfigEntry):
+        """Initialize the sensor."""
+        super().__init__(api_client, entry, "last_success")
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return the time of the last successful request."""
+        if (last_success := self._metrics.last_success) is None:
+            return None
+        return dt_util.utc_from_timestamp(last_success)
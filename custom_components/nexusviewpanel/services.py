@@ -0,0 +1,239 @@
+"""Services for NexusViewPanel."""
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+
+from .api import ApiError
+from .const import (
+    ATTR_AREA_ID,
+    ATTR_BRIGHTNESS,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_ENABLED,
+    ATTR_MAX_CONCURRENT,
+    ATTR_TAB_INDEX,
+    ATTR_TAB_TITLE,
+    ATTR_TIMEOUT,
+    BULK_MAX_CONCURRENT,
+    BULK_TIMEOUT,
+    COORDINATOR_CONFIG,
+    DOMAIN,
+    LOGGER,
+    NEXUS_API_CLIENT,
+    SERVICE_CLOSE_FLOATING,
+    SERVICE_DISPLAY_OFF,
+    SERVICE_DISPLAY_ON,
+    SERVICE_FLOAT_TAB,
+    SERVICE_RELOAD_TAB,
+    SERVICE_SET_BRIGHTNESS,
+    SERVICE_SET_TRACING,
+)
+
+TARGET_SCHEMA = {
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional(ATTR_AREA_ID): vol.All(cv.ensure_list, [cv.string]),
+}
+
+BULK_SCHEMA = {
+    **TARGET_SCHEMA,
+    vol.Optional(ATTR_MAX_CONCURRENT, default=BULK_MAX_CONCURRENT): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=100)
+    ),
+    vol.Optional(ATTR_TIMEOUT, default=BULK_TIMEOUT): vol.All(
+        vol.Coerce(float), vol.Range(min=1, max=300)
+    ),
+}
+
+SET_TRACING_SCHEMA = vol.Schema(
+    {vol.Required(ATTR_ENABLED): cv.boolean, **TARGET_SCHEMA}
+)
+BULK_ACTION_SCHEMA = vol.Schema(BULK_SCHEMA)
+SET_BRIGHTNESS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_BRIGHTNESS): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=100)
+        ),
+        **BULK_SCHEMA,
+    }
+)
+TAB_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Exclusive(ATTR_TAB_INDEX, "tab"): vol.All(
+                vol.Coerce(int), vol.Range(min=0)
+            ),
+            vol.Exclusive(ATTR_TAB_TITLE, "tab"): cv.string,
+            **BULK_SCHEMA,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_TAB_INDEX, ATTR_TAB_TITLE),
+)
+
+
+@callback
+def _async_get_targets(hass: HomeAssistant, call: ServiceCall) -> dict[str, dict[str, Any]]:
+    """Return the loaded entries a service call targets, all if none is given."""
+    entries = {
+        entry_id: data
+        for entry_id, data in hass.data.get(DOMAIN, {}).items()
+        if isinstance(data, dict) and NEXUS_API_CLIENT in data
+    }
+    entry_ids = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    area_ids = call.data.get(ATTR_AREA_ID)
+    if entry_ids is None and area_ids is None:
+        return entries
+
+    selected: set[str] = set(entry_ids or ())
+    if unknown := selected - entries.keys():
+        raise ServiceValidationError(
+            f"No loaded NexusViewPanel entry {', '.join(sorted(unknown))}"
+        )
+    if area_ids:
+        device_registry = dr.async_get(hass)
+        for area_id in area_ids:
+            for device in dr.async_entries_for_area(device_registry, area_id):
+                selected.update(device.config_entries & entries.keys())
+    return {entry_id: entries[entry_id] for entry_id in selected}
+
+
+def _find_tab(data: dict[str, Any], call: ServiceCall) -> int:
+    """Return the index of the tab a service call names."""
+    if (index := call.data.get(ATTR_TAB_INDEX)) is not None:
+        return index
+    config = data[COORDINATOR_CONFIG].data or {}
+    for index, tab in enumerate(config.get("tabs", ())):
+        if tab.get("title") == call.data[ATTR_TAB_TITLE]:
+            return index
+    raise ApiError(f"Tab '{call.data[ATTR_TAB_TITLE]}' nicht gefunden")
+
+
+async def _async_run_bulk(
+    hass: HomeAssistant,
+    call: ServiceCall,
+    action: Callable[[dict[str, Any]], Awaitable[Any]],
+) -> ServiceResponse:
+    """Run an action on all targeted panels, with bounded concurrency.
+
+    Each panel gets its own timeout; a failing panel does not affect the
+    others. Returns the outcome per config entry.
+    """
+    targets = _async_get_targets(hass, call)
+    semaphore = asyncio.Semaphore(call.data[ATTR_MAX_CONCURRENT])
+    timeout = call.data[ATTR_TIMEOUT]
+
+    async def run(entry_id: str, data: dict[str, Any]) -> dict[str, Any]:
+        entry = hass.config_entries.async_get_entry(entry_id)
+        result: dict[str, Any] = {"name": entry.title if entry else entry_id}
+        async with semaphore:
+            try:
+                async with asyncio.timeout(timeout):
+                    await action(data)
+            except TimeoutError:
+                result.update(success=False, error="timeout")
+            except ApiError as err:
+                result.update(success=False, error=str(err))
+            else:
+                result.update(success=True, error=None)
+        return result
+
+    results = await asyncio.gather(*(run(*item) for item in targets.items()))
+    failed = sum(not result["success"] for result in results)
+    if failed:
+        LOGGER.warning(
+            "%s failed on %d of %d panels", call.service, failed, len(results)
+        )
+    return {
+        "succeeded": len(results) - failed,
+        "failed": failed,
+        "results": dict(zip(targets, results)),
+    }
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    @callback
+    def async_set_tracing(call: ServiceCall) -> None:
+        """Turn request tracing on or off."""
+        for data in _async_get_targets(hass, call).values():
+            data[NEXUS_API_CLIENT].trace.enabled = call.data[ATTR_ENABLED]
+        LOGGER.info(
+            "Request tracing %s", "enabled" if call.data[ATTR_ENABLED] else "disabled"
+        )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_TRACING, async_set_tracing, schema=SET_TRACING_SCHEMA
+    )
+
+    async def async_display_on(call: ServiceCall) -> ServiceResponse:
+        """Turn the display of the panels on."""
+        return await _async_run_bulk(
+            hass, call, lambda data: data[NEXUS_API_CLIENT].async_display_on()
+        )
+
+    async def async_display_off(call: ServiceCall) -> ServiceResponse:
+        """Turn the display of the panels off."""
+        return await _async_run_bulk(
+            hass, call, lambda data: data[NEXUS_API_CLIENT].async_display_off()
+        )
+
+    async def async_set_brightness(call: ServiceCall) -> ServiceResponse:
+        """Set the configured brightness of the panels."""
+
+        return await _async_run_bulk(
+            hass,
+            call,
+            lambda data: data[NEXUS_API_CLIENT].async_set_brightness(
+                call.data[ATTR_BRIGHTNESS]
+            ),
+        )
+
+    async def async_reload_tab(call: ServiceCall) -> ServiceResponse:
+        """Reload a tab on the panels."""
+        return await _async_run_bulk(
+            hass,
+            call,
+            lambda data: data[NEXUS_API_CLIENT].async_reload_tab(_find_tab(data, call)),
+        )
+
+    async def async_float_tab(call: ServiceCall) -> ServiceResponse:
+        """Float a tab on the panels."""
+        return await _async_run_bulk(
+            hass,
+            call,
+            lambda data: data[NEXUS_API_CLIENT].async_float_tab(_find_tab(data, call)),
+        )
+
+    async def async_close_floating(call: ServiceCall) -> ServiceResponse:
+        """Close the floating window of the panels."""
+        return await _async_run_bulk(
+            hass, call, lambda data: data[NEXUS_API_CLIENT].async_close_floating()
+        )
+
+    for service, handler, schema in (
+        (SERVICE_DISPLAY_ON, async_display_on, BULK_ACTION_SCHEMA),
+        (SERVICE_DISPLAY_OFF, async_display_off, BULK_ACTION_SCHEMA),
+        (SERVICE_SET_BRIGHTNESS, async_set_brightness, SET_BRIGHTNESS_SCHEMA),
+        (SERVICE_RELOAD_TAB, async_reload_tab, TAB_SCHEMA),
+        (SERVICE_FLOAT_TAB, async_float_tab, TAB_SCHEMA),
+        (SERVICE_CLOSE_FLOATING, async_close_floating, BULK_ACTION_SCHEMA),
+    ):
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            handler,
+            schema=schema,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
@@ -0,0 +1,92 @@
+"""Dedicated HTTP connection pool for NexusViewPanel devices."""
+from aiohttp import ClientSession, TCPConnector
+from aiohttp.abc import AbstractResolver
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant
+
+from .const import (
+    DOMAIN,
+    PANEL_RESOLVER,
+    PANEL_SESSION,
+    POOL_DNS_CACHE_TTL,
+    POOL_KEEPALIVE_TIMEOUT,
+    POOL_LIMIT_PER_HOST,
+)
+
+
+def create_panel_session(resolver: AbstractResolver | None = None) -> ClientSession:
+    """Create a session tuned for polling many slow panels.
+
+    Idle connections are kept longer than the default device poll interval
+    so every poll can reuse one, and resolved host names (e.g. mDNS) are
+    cached instead of being looked up for each request.
+    """
+    connector = TCPConnector(
+        limit_per_host=POOL_LIMIT_PER_HOST,
+        keepalive_timeout=POOL_KEEPALIVE_TIMEOUT,
+        use_dns_cache=True,
+        ttl_dns_cache=POOL_DNS_CACHE_TTL,
+        resolver=resolver,
+    )
+    return ClientSession(connector=connector)
+
+
+async def _async_create_resolver(hass: HomeAssistant) -> AbstractResolver | None:
+    """Return a resolver that looks up .local names over mDNS, like HA's sessions.
+
+    Uses the zeroconf instance of Home Assistant; without the zeroconf
+    integration, aiohttp's default resolver is used.
+    """
+    if "zeroconf" not in hass.config.components:
+        return None
+    # Only needed, and only imported, when zeroconf is set up.
+    from aiohttp_asyncmdnsresolver.api import AsyncDualMDNSResolver
+    from homeassistant.components import zeroconf
+
+    return AsyncDualMDNSResolver(
+        async_zeroconf=await zeroconf.async_get_async_instance(hass)
+    )
+
+
+async def async_get_panel_session(hass: HomeAssistant) -> ClientSession:
+    """Return the session shared by all panels, creating it if needed."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (session := domain_data.get(PANEL_SESSION)) is not None:
+        return session
+
+    resolver = await _async_create_resolver(hass)
+    if (session := domain_data.get(PANEL_SESSION)) is not None:
+        # Created by another entry while waiting for zeroconf.
+        if resolver is not None:
+            await resolver.close()
+        return session
+
+    session = domain_data[PANEL_SESSION] = create_panel_session(resolver)
+    domain_data[PANEL_RESOLVER] = resolver
+
+    async def _async_close_session(_event: Event) -> None:
+        await async_close_panel_session(hass)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    return session
+
+
+async def async_close_panel_session(hass: HomeAssistant) -> None:
+    """Close the shared session and its resolver, if open."""
+    domain_data = hass.data.get(DOMAIN, {})
+    if (session := domain_data.pop(PANEL_SESSION, None)) is not None:
+        await session.close()
+    if (resolver := domain_data.pop(PANEL_RESOLVER, None)) is not None:
+        await resolver.close()
+
+
+async def async_release_panel_session(hass: HomeAssistant, entry_id: str) -> None:
+    """Close the shared session once no other entry is using it."""
+    if not any(
+        entry.entry_id != entry_id
+        and entry.state
+        in (ConfigEntryState.LOADED, ConfigEntryState.SETUP_IN_PROGRESS)
+        for entry in hass.config_entries.async_entries(DOMAIN)
+    ):
+        await async_close_panel_session(hass)
@@ -0,0 +1,111 @@
+"""Warm-start snapshots of NexusViewPanel device and config data."""
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    LOGGER,
+    SNAPSHOT_MAX_AGE,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_STORAGE_VERSION,
+)
+from .projection import CONFIG_PROJECTION, project, thaw
+
+
+class _SnapshotStore(Store[dict[str, Any]]):
+    """Store that discards snapshots of other schema versions."""
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: Any
+    ) -> dict[str, Any]:
+        """Drop the outdated snapshot, the next poll replaces it."""
+        return {}
+
+
+class NexusSnapshotCache:
+    """Last good device and config data of one panel, persisted across restarts."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the cache."""
+        self._store = _SnapshotStore(
+            hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._device: dict[str, Any] | None = None
+        self._config: Any = None
+        self._dirty = False
+        self._saved_at = 0.0
+        # Detected panel features, e.g. {"state_endpoint": True}.
+        self.capabilities: dict[str, Any] = {}
+
+    async def async_load(self) -> tuple[dict[str, Any] | None, Any]:
+        """Return the stored device and config data, if recent enough."""
+        try:
+            stored = await self._store.async_load()
+        except HomeAssistantError as err:
+            LOGGER.debug("Ignoring unreadable snapshot %s: %s", self._store.key, err)
+            return None, None
+        if not stored or time.time() - stored.get("saved_at", 0) > SNAPSHOT_MAX_AGE:
+            return None, None
+        self._saved_at = stored["saved_at"]
+        self.capabilities = stored.get("capabilities", {})
+        self._device = stored.get("device")
+        if (config := stored.get("config")) is not None:
+            self._config = project(config, CONFIG_PROJECTION)
+        return self._device, self._config
+
+    @callback
+    def async_update(
+        self,
+        device: dict[str, Any] | None,
+        config: Any,
+        capabilities: dict[str, Any] | None = None,
+    ) -> None:
+        """Remember new data and schedule a (coalesced) write.
+
+        The write happens SNAPSHOT_SAVE_DELAY seconds after the first change
+        and includes every change made until then. Unchanged data is only
+        rewritten when the snapshot is half its maximum age, so it does not
+        expire while the panel is running.
+        """
+        changed = time.time() - self._saved_at > SNAPSHOT_MAX_AGE / 2
+        if device is not None and device != self._device:
+            self._device = device
+            changed = True
+        if config is not None and config != self._config:
+            self._config = config
+            changed = True
+        if capabilities is not None and capabilities != self.capabilities:
+            self.capabilities = capabilities
+            changed = True
+        if not changed or self._dirty:
+            # Store.async_delay_save is a debounce; re-arming it on every
+            # poll would postpone the write forever.
+            return
+        self._dirty = True
+        self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write a pending snapshot now, e.g. before the entry is unloaded."""
+        if self._dirty:
+            await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the snapshot to write."""
+        self._dirty = False
+        self._saved_at = time.time()
+        return {
+            "saved_at": self._saved_at,
+            "capabilities": self.capabilities,
+            "device": thaw(self._device),
+            "config": thaw(self._config),
+        }
+
+    async def async_remove(self) -> None:
+        """Delete the stored snapshot."""
+        LOGGER.debug("Removing snapshot %s", self._store.key)
+        await self._store.async_remove()
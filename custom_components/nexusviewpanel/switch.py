@@ -1,11 +1,22 @@
 """Switch platform for NexusViewPanel."""
+from datetime import datetime
+
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .api import NexusViewPanelApiClient
-from .const import DOMAIN, NEXUS_API_CLIENT
+from .api import ApiError, NexusViewPanelApiClient
+from .const import (
+    DOMAIN,
+    COORDINATOR_DEVICE,
+    DEVICE_KEY_SCREEN_ON,
+    DISPLAY_CONFIRM_DELAY,
+    LOGGER,
+    NEXUS_API_CLIENT,
+)
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -17,21 +28,29 @@ async def async_setup_entry(
     api_client = data[NEXUS_API_CLIENT]
     
     async_add_entities([
-        NexusDisplaySwitch(api_client, entry)
+        NexusDisplaySwitch(data[COORDINATOR_DEVICE], api_client, entry)
     ])
 
 
-class NexusDisplaySwitch(SwitchEntity):
-    """Represents the display On/Off switch."""
+class NexusDisplaySwitch(CoordinatorEntity, SwitchEntity):
+    """Represents the display On/Off switch.
+
+    A switch command is shown right away (optimistically) and confirmed by a
+    single device refresh DISPLAY_CONFIRM_DELAY seconds later. Until then,
+    polls that may predate the command don't override it.
+    """
 
     _attr_has_entity_name = True
     _attr_name = "Display"
     _attr_icon = "mdi:tablet-dashboard"
-    _attr_assumed_state = True
 
-    def __init__(self, api_client: NexusViewPanelApiClient, entry: ConfigEntry):
+    def __init__(self, coordinator, api_client: NexusViewPanelApiClient, entry: ConfigEntry):
         """Initialize the switch."""
+        super().__init__(coordinator, context=(DEVICE_KEY_SCREEN_ON,))
         self._api_client = api_client
+        self._optimistic: bool | None = None
+        self._confirm_at = 0.0
+        self._unsub_confirm: CALLBACK_TYPE | None = None
         self._attr_device_info = {
             "identifiers": {(DOMAIN, entry.entry_id)},
             "name": f"Nexus Panel ({entry.data['host']})",
@@ -39,10 +58,95 @@ class NexusDisplaySwitch(SwitchEntity):
         }
         self._attr_unique_id = f"{entry.entry_id}_display_switch"
 
+    @property
+    def _reported(self) -> bool | None:
+        """Return the screen state reported by the panel, if it reports one."""
+        if self.coordinator.data:
+            return self.coordinator.data.get(DEVICE_KEY_SCREEN_ON)
+        return None
+
+    @property
+    def assumed_state(self) -> bool:
+        """Return True if the panel does not report its screen state."""
+        return self._reported is None
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return the commanded state until confirmed, then the reported one."""
+        if self._optimistic is not None:
+            return self._optimistic
+        return self._reported
+
+    @callback
+    def _async_reconcile(self) -> None:
+        """Drop the optimistic state once data read after the command is in."""
+        if (
+            self._optimistic is None
+            or self._reported is None
+            or not self.coordinator.last_update_success
+            or self.hass.loop.time() < self._confirm_at
+        ):
+            return
+        if self._reported != self._optimistic:
+            LOGGER.debug(
+                "%s reports display %s after switching it %s",
+                self.entity_id,
+                "on" if self._reported else "off",
+                "on" if self._optimistic else "off",
+            )
+        self._optimistic = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._async_reconcile()
+        super()._handle_coordinator_update()
+
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the display on."""
-        await self._api_client.async_display_on()
+        await self._async_switch(True)
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn the display off."""
-        await self._api_client.async_display_off()
+        await self._async_switch(False)
+
+    async def _async_switch(self, on: bool) -> None:
+        """Show the new state at once, send it and schedule the read-back."""
+        self._optimistic = on
+        # Polls finishing before the command went out can't confirm it.
+        self._confirm_at = float("inf")
+        self.async_write_ha_state()
+        try:
+            if on:
+                sent = await self._api_client.async_display_on()
+            else:
+                sent = await self._api_client.async_display_off()
+        except ApiError:
+            if self._optimistic is on:
+                self._optimistic = None
+                self.async_write_ha_state()
+            raise
+        # A superseded call leaves confirming to the call that replaced it.
+        if sent:
+            self._confirm_at = self.hass.loop.time() + DISPLAY_CONFIRM_DELAY
+            if self._unsub_confirm:
+                self._unsub_confirm()
+            self._unsub_confirm = async_call_later(
+                self.hass, DISPLAY_CONFIRM_DELAY, self._async_confirm
+            )
+
+    async def _async_confirm(self, _now: datetime) -> None:
+        """Read the screen state back once."""
+        self._unsub_confirm = None
+        # The screen state may not have changed, so this entity isn't
+        # necessarily notified; reconcile explicitly.
+        await self.coordinator.async_refresh()
+        self._async_reconcile()
+        self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending read-back."""
+        if self._unsub_confirm:
+            self._unsub_confirm()
+            self._unsub_confirm = None
+        await super().async_will_remove_from_hass()
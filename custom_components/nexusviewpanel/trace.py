@@ -0,0 +1,96 @@
+"""Request tracing for NexusViewPanel API clients."""
+from collections import deque
+import time
+from typing import Any
+
+from aiohttp import ClientResponseError
+
+from .const import TRACE_BODY_LIMIT, TRACE_BODYLESS_PATHS, TRACE_BUFFER_SIZE
+
+
+def _describe_error(error: BaseException) -> str:
+    """Return the type and message of an error, without request details.
+
+    The repr of a ClientResponseError includes the request headers and with
+    them the API token.
+    """
+    if isinstance(error, ClientResponseError):
+        return f"{type(error).__name__}: {error.status} {error.message}"
+    if message := str(error):
+        return f"{type(error).__name__}: {message}"
+    return type(error).__name__
+
+
+class RequestTrace:
+    """Ring buffer of the last requests to one panel.
+
+    Callers check `enabled` before recording, so a disabled trace costs a
+    single attribute lookup per request. Records are kept when tracing is
+    turned off, so they can still be downloaded afterwards. Bodies of
+    TRACE_BODYLESS_PATHS are not kept, errors only as type and message.
+    """
+
+    def __init__(
+        self, size: int = TRACE_BUFFER_SIZE, body_limit: int = TRACE_BODY_LIMIT
+    ) -> None:
+        """Initialize the trace."""
+        self.enabled = False
+        self.body_limit = body_limit
+        self._records: deque[tuple] = deque(maxlen=size)
+
+    def record(
+        self,
+        method: str,
+        path: str,
+        params: Any,
+        status: int | None,
+        duration: float,
+        body: bytes | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """Record a finished request; the body is truncated to body_limit."""
+        kept_body = (
+            body[: self.body_limit]
+            if body and path not in TRACE_BODYLESS_PATHS
+            else None
+        )
+        self._records.append(
+            (
+                time.time(),
+                method,
+                path,
+                params,
+                status,
+                duration,
+                kept_body,
+                len(body) if body else 0,
+                _describe_error(error) if error else None,
+            )
+        )
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the records, oldest first, for diagnostics."""
+        return [
+            {
+                "time": timestamp,
+                "method": method,
+                "path": path,
+                "params": repr(params) if params else None,
+                "status": status,
+                "duration": round(duration, 4),
+                "body": body.decode("utf-8", "replace") if body else None,
+                "body_size": body_size,
+                "error": error,
+            }
+            for (
+                timestamp,
+                method,
+                path,
+                params,
+                status,
+                duration,
+                body,
+                body_size,
+                error,
+            ) in self._records
+        ]
@@ -0,0 +1,117 @@
+"""Benchmark the dedicated panel connection pool against a local fake panel.
+
+Compares two ways of polling /api/device:
+
+* baseline: every request resolves the host name and opens a new TCP
+  connection. This is what happens with the shared default session when the
+  poll interval (60 s) is longer than its keep-alive (15 s).
+* pooled: the session from session.create_panel_session(), which keeps
+  connections alive across polls and caches DNS lookups.
+
+The fake resolver adds --dns-delay to every lookup to stand in for mDNS.
+Requires Home Assistant to be importable (run it from a HA dev environment).
+
+Example:
+    python scripts/bench_connection_pool.py --panels 20 --requests 50
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+from aiohttp import ClientSession, TCPConnector, web
+from aiohttp.resolver import DefaultResolver
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from custom_components.nexusviewpanel.api import NexusViewPanelApiClient  # noqa: E402
+from custom_components.nexusviewpanel.session import create_panel_session  # noqa: E402
+
+
+class _SlowResolver(DefaultResolver):
+    """Resolver that adds a fixed delay and counts lookups."""
+
+    def __init__(self, delay: float) -> None:
+        super().__init__()
+        self.delay = delay
+        self.lookups = 0
+
+    async def resolve(self, *args, **kwargs):
+        self.lookups += 1
+        await asyncio.sleep(self.delay)
+        return await super().resolve(*args, **kwargs)
+
+
+async def _start_fake_panels(count: int, base_port: int, latency: float):
+    """Serve /api/device on count ports and count new connections."""
+    connections: set[tuple] = set()
+
+    async def device(request: web.Request) -> web.Response:
+        connections.add(request.transport.get_extra_info("peername"))
+        await asyncio.sleep(latency)
+        return web.json_response({"batteryLevel": 80, "screenOn": True})
+
+    app = web.Application()
+    app.router.add_get("/api/device", device)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    for port in range(base_port, base_port + count):
+        await web.TCPSite(runner, "localhost", port).start()
+    return runner, connections
+
+
+async def _run(session: ClientSession, args: argparse.Namespace) -> list[float]:
+    """Poll every panel sequentially, all panels concurrently."""
+    latencies: list[float] = []
+
+    async def poll(port: int) -> None:
+        client = NexusViewPanelApiClient("localhost", port, "token", session, freshness=0)
+        for _ in range(args.requests):
+            start = time.perf_counter()
+            await client.async_get_device()
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(poll(args.port + i) for i in range(args.panels)))
+    return latencies
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run both variants and print a comparison."""
+    runner, connections = await _start_fake_panels(args.panels, args.port, args.latency)
+    try:
+        for name in ("baseline", "pooled"):
+            resolver = _SlowResolver(args.dns_delay)
+            if name == "baseline":
+                session = ClientSession(
+                    connector=TCPConnector(
+                        force_close=True, use_dns_cache=False, resolver=resolver
+                    )
+                )
+            else:
+                session = create_panel_session(resolver=resolver)
+            connections.clear()
+            cpu = time.process_time()
+            async with session:
+                latencies = await _run(session, args)
+            cpu = time.process_time() - cpu
+            latencies.sort()
+            print(
+                f"{name:9} p50 {statistics.median(latencies) * 1000:6.2f} ms"
+                f"  p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:6.2f} ms"
+                f"  cpu {cpu / len(latencies) * 1e6:7.1f} us/req"
+                f"  dns {resolver.lookups:5}  connections {len(connections):5}"
+            )
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--panels", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=50, help="per panel")
+    parser.add_argument("--port", type=int, default=18800, help="first fake panel port")
+    parser.add_argument("--latency", type=float, default=0.005, help="server delay [s]")
+    parser.add_argument("--dns-delay", type=float, default=0.02, help="lookup delay [s]")
+    asyncio.run(main(parser.parse_args()))
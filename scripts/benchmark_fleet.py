@@ -0,0 +1,216 @@
+"""Fleet-scale benchmark for the NexusViewPanel integration.
+
+Starts a minimal Home Assistant core with this integration, adds N config
+entries through the real config flow against fake panels (see
+fake_panel_server.py) and lets them poll for a while. Reports:
+
+* requests per second served by the fake panels
+* p50/p99 coordinator refresh latency
+* event loop lag (p50/p99/max)
+* state_changed events per minute
+* memory allocated per config entry during setup (tracemalloc)
+
+Every fake panel listens on its own loopback address (127.0.x.y), which
+works out of the box on Linux. Requires Home Assistant to be importable
+(run it from a HA dev environment).
+
+Example:
+    python scripts/benchmark_fleet.py --entries 100 --duration 60 \\
+        --device-interval 5 --config-interval 60
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from homeassistant import auth, bootstrap, config_entries, loader
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from custom_components.nexusviewpanel.const import (  # noqa: E402
+    COORDINATOR_CONFIG,
+    COORDINATOR_DEVICE,
+    DOMAIN,
+)
+from fake_panel_server import FakePanelFleet, FakePanelOptions  # noqa: E402
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """Return the pct percentile of values."""
+    if not values:
+        return float("nan")
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct))]
+
+
+async def _async_start_hass(config_dir: str, http_port: int) -> HomeAssistant:
+    """Create a Home Assistant core that can load this custom integration."""
+    os.symlink(
+        os.path.join(ROOT, "custom_components"),
+        os.path.join(config_dir, "custom_components"),
+    )
+    hass = HomeAssistant(config_dir)
+    loader.async_setup(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await bootstrap.async_load_base_functionality(hass)
+    hass.auth = await auth.auth_manager_from_config(hass, [], [])
+    # The push view needs http; keep it off the default port.
+    await async_setup_component(hass, "http", {"http": {"server_port": http_port}})
+    return hass
+
+
+async def _async_add_entry(hass: HomeAssistant, host: str, port: int, args) -> None:
+    """Add one panel through the config flow."""
+    flow = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    flow = await hass.config_entries.flow.async_configure(
+        flow["flow_id"], {"next_step_id": "manual"}
+    )
+    flow = await hass.config_entries.flow.async_configure(
+        flow["flow_id"], {"host": host, "port": port, "api_token": args.token}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        flow["flow_id"],
+        {
+            "name": f"Bench {host}:{port}",
+            "device_interval": args.device_interval,
+            "config_interval": args.config_interval,
+        },
+    )
+    if result["type"] != "create_entry":
+        raise RuntimeError(f"Adding {host}:{port} failed: {result}")
+
+
+def _time_refreshes(hass: HomeAssistant, latencies: list[float]) -> None:
+    """Wrap every coordinator update method to record its duration."""
+    for data in hass.data[DOMAIN].values():
+        if not isinstance(data, dict) or COORDINATOR_DEVICE not in data:
+            continue
+        for key in (COORDINATOR_DEVICE, COORDINATOR_CONFIG):
+            coordinator = data[key]
+            update_method = coordinator.update_method
+
+            async def timed(update_method=update_method):
+                start = time.perf_counter()
+                try:
+                    return await update_method()
+                finally:
+                    latencies.append(time.perf_counter() - start)
+
+            coordinator.update_method = timed
+
+
+async def _measure_loop_lag(lags: list[float], interval: float = 0.05) -> None:
+    """Record how late the event loop wakes up a sleeping task."""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        lags.append(loop.time() - start - interval)
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the benchmark and print the results."""
+    fleet = FakePanelFleet(
+        FakePanelOptions(
+            token=args.token,
+            latency=args.latency,
+            failure_rate=args.failure_rate,
+            payload_size=args.payload_size,
+            tab_count=args.tabs,
+            state_endpoint=args.state_endpoint,
+        )
+    )
+    # Panels are identified by host, so give each its own loopback address.
+    hosts = [f"127.0.{i // 250}.{i % 250 + 1}" for i in range(args.entries)]
+    await fleet.start(args.entries, args.port, hosts)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await _async_start_hass(config_dir, args.http_port)
+
+        tracemalloc.start()
+        base_memory = tracemalloc.get_traced_memory()[0]
+        setup_start = time.perf_counter()
+        sem = asyncio.Semaphore(args.setup_concurrency)
+
+        async def add(host: str, port: int) -> None:
+            async with sem:
+                await _async_add_entry(hass, host, port, args)
+
+        await asyncio.gather(*(add(host, port) for host, port in fleet.panels))
+        await hass.async_block_till_done()
+        setup_time = time.perf_counter() - setup_start
+        memory = (tracemalloc.get_traced_memory()[0] - base_memory) / args.entries
+        tracemalloc.stop()
+
+        refresh_latencies: list[float] = []
+        lags: list[float] = []
+        state_changes = 0
+
+        def count_state_change(_event) -> None:
+            nonlocal state_changes
+            state_changes += 1
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, count_state_change)
+        _time_refreshes(hass, refresh_latencies)
+        lag_task = asyncio.create_task(_measure_loop_lag(lags))
+
+        async def drift() -> None:
+            while True:
+                await asyncio.sleep(args.drift_interval)
+                for panel in fleet.panels.values():
+                    panel.drift_battery()
+
+        drift_task = asyncio.create_task(drift())
+        requests_start = fleet.requests
+        await asyncio.sleep(args.duration)
+        requests = fleet.requests - requests_start
+        lag_task.cancel()
+        drift_task.cancel()
+
+        print(f"entries:              {args.entries}")
+        print(f"setup time:           {setup_time:.1f} s")
+        print(f"memory per entry:     {memory / 1024:.1f} KiB")
+        print(f"requests/s:           {requests / args.duration:.1f}")
+        print(
+            f"refresh latency:      p50 {_percentile(refresh_latencies, 0.5) * 1000:.1f} ms"
+            f"  p99 {_percentile(refresh_latencies, 0.99) * 1000:.1f} ms"
+            f"  ({len(refresh_latencies)} refreshes)"
+        )
+        print(
+            f"event loop lag:       p50 {_percentile(lags, 0.5) * 1000:.1f} ms"
+            f"  p99 {_percentile(lags, 0.99) * 1000:.1f} ms"
+            f"  max {max(lags, default=0) * 1000:.1f} ms"
+        )
+        print(f"state_changed/min:    {state_changes / args.duration * 60:.0f}")
+
+        await hass.async_stop(force=True)
+    await fleet.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=10, help="10 to 1000")
+    parser.add_argument("--duration", type=float, default=60.0, help="seconds")
+    parser.add_argument("--device-interval", type=int, default=5)
+    parser.add_argument("--config-interval", type=int, default=60)
+    parser.add_argument("--port", type=int, default=19000, help="fake panel port")
+    parser.add_argument("--http-port", type=int, default=18123, help="for HA's http")
+    parser.add_argument("--token", default="token")
+    parser.add_argument("--latency", type=float, default=0.01, help="mean delay [s]")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--payload-size", type=int, default=0, help="extra config bytes")
+    parser.add_argument("--tabs", type=int, default=3)
+    parser.add_argument("--state-endpoint", action="store_true", help="serve /api/state")
+    parser.add_argument("--drift-interval", type=float, default=10.0, help="seconds")
+    parser.add_argument("--setup-concurrency", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
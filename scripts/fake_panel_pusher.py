@@ -0,0 +1,96 @@
+"""Fake NexusViewPanel pusher for load-testing the push receiver.
+
+Simulates a fleet of panels that POST device/config deltas to
+/api/nexusviewpanel/push/<entry_id> on a running Home Assistant instance.
+
+Example:
+    python scripts/fake_panel_pusher.py --url http://localhost:8123 \\
+        --panel ENTRY_ID_1:TOKEN_1 --panel ENTRY_ID_2:TOKEN_2 \\
+        --rate 2 --duration 60
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from aiohttp import ClientSession, ClientTimeout
+
+
+def _random_delta() -> dict:
+    """Build a delta like the one a panel would push after a change."""
+    if random.random() < 0.8:
+        return {"device": {"batteryLevel": random.randint(20, 100)}}
+    return {"config": {"brightness": random.randint(0, 100)}}
+
+
+async def _run_panel(
+    session: ClientSession,
+    url: str,
+    token: str,
+    rate: float,
+    deadline: float,
+    latencies: list[float],
+    errors: list[int],
+) -> None:
+    """Push deltas for one panel at the given rate until the deadline."""
+    headers = {"Authorization": f"Bearer {token}"}
+    # Start panels at random offsets so they don't push in lockstep.
+    await asyncio.sleep(random.random() / rate)
+    while time.monotonic() < deadline:
+        start = time.monotonic()
+        try:
+            async with session.post(url, json=_random_delta(), headers=headers) as resp:
+                await resp.read()
+                if resp.status != 200:
+                    errors.append(resp.status)
+        except Exception:  # noqa: BLE001 - any failure counts as an error
+            errors.append(0)
+        latencies.append(time.monotonic() - start)
+        await asyncio.sleep(max(0.0, 1 / rate - (time.monotonic() - start)))
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run all fake panels and print a summary."""
+    latencies: list[float] = []
+    errors: list[int] = []
+    deadline = time.monotonic() + args.duration
+
+    async with ClientSession(timeout=ClientTimeout(total=10)) as session:
+        await asyncio.gather(
+            *(
+                _run_panel(
+                    session,
+                    f"{args.url}/api/nexusviewpanel/push/{entry_id}",
+                    token,
+                    args.rate,
+                    deadline,
+                    latencies,
+                    errors,
+                )
+                for entry_id, token in (p.split(":", 1) for p in args.panel)
+            )
+        )
+
+    if not latencies:
+        print("No pushes sent")
+        return
+    latencies.sort()
+    print(f"pushes:     {len(latencies)} ({len(latencies) / args.duration:.1f}/s)")
+    print(f"errors:     {len(errors)}")
+    print(f"p50 [ms]:   {statistics.median(latencies) * 1000:.1f}")
+    print(f"p99 [ms]:   {latencies[int(len(latencies) * 0.99) - 1] * 1000:.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8123")
+    parser.add_argument(
+        "--panel",
+        action="append",
+        required=True,
+        help="ENTRY_ID:TOKEN of a configured panel, may be repeated",
+    )
+    parser.add_argument("--rate", type=float, default=1.0, help="pushes/s per panel")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,234 @@
+"""Fake NexusViewPanel API server for local testing and benchmarks.
+
+Implements /api/device, /api/config, /api/display/{on,off,brightness},
+/api/floating/close and /api/tabs/{i}/{reload,float} with configurable
+latency, failure rate, payload size and tab count. With --state-endpoint the
+panels also serve the combined /api/state (device and config in one
+response). Many panels can be
+served at once, each on its own port (and optionally its own loopback
+address, e.g. 127.0.0.2, 127.0.0.3, ... on Linux).
+
+Run standalone:
+    python scripts/fake_panel_server.py --panels 3 --port 18080 --token secret
+"""
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+import hashlib
+import json
+import random
+from typing import Any
+
+from aiohttp import web
+
+
+@dataclass
+class FakePanelOptions:
+    """Behaviour shared by all fake panels of a fleet."""
+
+    token: str = "token"
+    latency: float = 0.0
+    failure_rate: float = 0.0
+    payload_size: int = 0
+    tab_count: int = 3
+    state_endpoint: bool = False
+
+
+@dataclass
+class FakePanel:
+    """State of one fake panel."""
+
+    options: FakePanelOptions
+    device: dict[str, Any] = field(default_factory=dict)
+    config: dict[str, Any] = field(default_factory=dict)
+    requests: int = 0
+    bytes_sent: int = 0
+    _config_body: bytes | None = None
+
+    def __post_init__(self) -> None:
+        """Build the initial device and config documents."""
+        self.device = {"batteryLevel": random.randint(40, 100), "screenOn": True}
+        self.config = {
+            "brightness": 50,
+            "kioskMode": False,
+            "fullscreen": True,
+            "reloadOnTabReselect": False,
+            "reloadOnSwipe": False,
+            "reloadOnWakeup": True,
+            "runOnReboot": True,
+            "deviceAdminLock": False,
+            "tabsSwipable": True,
+            "floatingView": {"enabled": False, "position": "top-right"},
+            "pinProtection": {"enabled": False},
+            "tabs": [
+                {
+                    "id": f"tab-{i}",
+                    "title": f"Dashboard {i}",
+                    "url": f"http://homeassistant.local:8123/lovelace/{i}",
+                }
+                for i in range(self.options.tab_count)
+            ],
+            # Stands in for custom CSS/JS and other settings entities ignore.
+            "customCss": "x" * self.options.payload_size,
+        }
+
+    def config_body(self) -> bytes:
+        """Return the encoded config, cached until it changes."""
+        if self._config_body is None:
+            self._config_body = json.dumps(self.config).encode()
+        return self._config_body
+
+    def set_config(self, key: str, value: Any) -> None:
+        """Change a config value."""
+        self.config[key] = value
+        self._config_body = None
+
+    def drift_battery(self) -> None:
+        """Let the battery level flap like a charging tablet."""
+        level = self.device["batteryLevel"] + random.choice((-1, 1))
+        self.device["batteryLevel"] = max(0, min(100, level))
+
+
+class FakePanelFleet:
+    """Serves any number of fake panels from one aiohttp application."""
+
+    def __init__(self, options: FakePanelOptions | None = None) -> None:
+        """Initialize the fleet."""
+        self.options = options or FakePanelOptions()
+        self.panels: dict[tuple[str, int], FakePanel] = {}
+        self._runner: web.AppRunner | None = None
+
+    @property
+    def requests(self) -> int:
+        """Return the number of requests served by all panels."""
+        return sum(panel.requests for panel in self.panels.values())
+
+    async def start(self, count: int, port: int, hosts: list[str] | None = None) -> None:
+        """Start count panels on consecutive ports of each host."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/api/device", self._device)
+        app.router.add_get("/api/config", self._config)
+        app.router.add_get("/api/state", self._state)
+        app.router.add_post("/api/display/on", self._display_on)
+        app.router.add_post("/api/display/off", self._display_off)
+        app.router.add_post("/api/display/brightness", self._brightness)
+        app.router.add_post("/api/floating/close", self._ok)
+        app.router.add_post("/api/tabs/{index}/{action:reload|float}", self._tab)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+
+        hosts = hosts or ["127.0.0.1"]
+        for i in range(count):
+            host = hosts[i % len(hosts)]
+            panel_port = port + i // len(hosts)
+            self.panels[(host, panel_port)] = FakePanel(self.options)
+            await web.TCPSite(self._runner, host, panel_port).start()
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner:
+            await self._runner.cleanup()
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Resolve the panel, check auth and simulate latency and failures."""
+        host, port = request.transport.get_extra_info("sockname")[:2]
+        panel = self.panels[(host, port)]
+        panel.requests += 1
+        if request.headers.get("Authorization") != f"Bearer {self.options.token}":
+            return web.json_response({"error": "unauthorized"}, status=401)
+        if self.options.latency:
+            await asyncio.sleep(random.expovariate(1 / self.options.latency))
+        if random.random() < self.options.failure_rate:
+            return web.json_response({"error": "simulated failure"}, status=500)
+        request["panel"] = panel
+        response = await handler(request)
+        if response.body is not None:
+            panel.bytes_sent += len(response.body)
+        return response
+
+    async def _device(self, request: web.Request) -> web.Response:
+        return web.json_response(request["panel"].device)
+
+    async def _config(self, request: web.Request) -> web.Response:
+        body = request["panel"].config_body()
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(
+            body=body, content_type="application/json", headers={"ETag": etag}
+        )
+
+    async def _state(self, request: web.Request) -> web.Response:
+        if not self.options.state_endpoint:
+            raise web.HTTPNotFound()
+        panel = request["panel"]
+        body = json.dumps({"device": panel.device, "config": panel.config}).encode()
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(
+            body=body, content_type="application/json", headers={"ETag": etag}
+        )
+
+    async def _display_on(self, request: web.Request) -> web.Response:
+        request["panel"].device["screenOn"] = True
+        return await self._ok(request)
+
+    async def _display_off(self, request: web.Request) -> web.Response:
+        request["panel"].device["screenOn"] = False
+        return await self._ok(request)
+
+    async def _brightness(self, request: web.Request) -> web.Response:
+        request["panel"].set_config("brightness", int(request.query["value"]))
+        return await self._ok(request)
+
+    async def _tab(self, request: web.Request) -> web.Response:
+        if int(request.match_info["index"]) >= len(request["panel"].config["tabs"]):
+            return web.json_response({"error": "no such tab"}, status=404)
+        return await self._ok(request)
+
+    async def _ok(self, request: web.Request) -> web.Response:
+        return web.json_response({"success": True})
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Serve a fleet until interrupted."""
+    fleet = FakePanelFleet(
+        FakePanelOptions(
+            token=args.token,
+            latency=args.latency,
+            failure_rate=args.failure_rate,
+            payload_size=args.payload_size,
+            tab_count=args.tabs,
+            state_endpoint=args.state_endpoint,
+        )
+    )
+    await fleet.start(args.panels, args.port, args.host)
+    for host, port in fleet.panels:
+        print(f"http://{host}:{port}/swagger?api_token={args.token}")
+    try:
+        while True:
+            await asyncio.sleep(args.drift_interval)
+            for panel in fleet.panels.values():
+                panel.drift_battery()
+    finally:
+        await fleet.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--panels", type=int, default=1)
+    parser.add_argument("--port", type=int, default=18080)
+    parser.add_argument("--host", action="append", help="bind address, may be repeated")
+    parser.add_argument("--token", default="token")
+    parser.add_argument("--latency", type=float, default=0.0, help="mean delay [s]")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--payload-size", type=int, default=0, help="extra config bytes")
+    parser.add_argument("--tabs", type=int, default=3)
+    parser.add_argument("--state-endpoint", action="store_true", help="serve /api/state")
+    parser.add_argument("--drift-interval", type=float, default=30.0, help="seconds")
+    try:
+        asyncio.run(main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
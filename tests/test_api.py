@@ -0,0 +1,141 @@
+"""Tests for request sharing in the API client."""
+import asyncio
+import socket
+from typing import Any
+
+from aiohttp import ClientSession
+from fake_panel_server import FakePanelFleet, FakePanelOptions
+import pytest
+
+from custom_components.nexusviewpanel.api import ApiError, NexusViewPanelApiClient
+
+
+class FakeSend:
+    """Stands in for the HTTP round trip, held open until released."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str]] = []
+        self.release = asyncio.Event()
+        self.error: BaseException | None = None
+
+    async def __call__(self, method: str, path: str, conditional: bool = False, **kwargs) -> Any:
+        self.calls.append((method, path))
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return {"path": path}
+
+
+def make_client(monkeypatch: pytest.MonkeyPatch) -> tuple[NexusViewPanelApiClient, FakeSend]:
+    client = NexusViewPanelApiClient("127.0.0.1", 8080, "token", None)
+    send = FakeSend()
+    monkeypatch.setattr(client, "_send", send)
+    return client, send
+
+
+def test_concurrent_gets_share_one_request(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def run() -> None:
+        client, send = make_client(monkeypatch)
+        tasks = [asyncio.create_task(client.async_get_device()) for _ in range(3)]
+        await asyncio.sleep(0)
+        send.release.set()
+        results = await asyncio.gather(*tasks)
+        assert send.calls == [("GET", "/device")]
+        assert results[0] is results[1] is results[2]
+
+        # Reused within the freshness window.
+        assert await client.async_get_device() is results[0]
+        assert len(send.calls) == 1
+
+    asyncio.run(run())
+
+
+def test_joiners_receive_the_owners_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def run() -> None:
+        client, send = make_client(monkeypatch)
+        error = ApiError("Verbindung fehlgeschlagen")
+        send.error = error
+        tasks = [asyncio.create_task(client.async_get_device()) for _ in range(3)]
+        await asyncio.sleep(0)
+        send.release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert send.calls == [("GET", "/device")]
+        assert results == [error, error, error]
+
+        # Failures are not cached.
+        send.error = None
+        assert await client.async_get_device() == {"path": "/device"}
+        assert len(send.calls) == 2
+
+    asyncio.run(run())
+
+
+def test_cancelled_owner_cancels_joiners(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def run() -> None:
+        client, send = make_client(monkeypatch)
+        owner = asyncio.create_task(client.async_get_device())
+        await asyncio.sleep(0)
+        joiner = asyncio.create_task(client.async_get_device())
+        await asyncio.sleep(0)
+        owner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await joiner
+
+    asyncio.run(run())
+
+
+def test_identical_queued_commands_are_sent_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def run() -> None:
+        client, send = make_client(monkeypatch)
+        client.set_limits(1, 1, 1)
+        blocker = asyncio.create_task(client.async_close_floating())
+        await asyncio.sleep(0)
+        # Both wait behind the blocker for the only slot.
+        reloads = [asyncio.create_task(client.async_reload_tab(1)) for _ in range(2)]
+        await asyncio.sleep(0)
+        send.release.set()
+        await asyncio.gather(blocker, *reloads)
+        assert send.calls == [("POST", "/floating/close"), ("POST", "/tabs/1/reload")]
+
+    asyncio.run(run())
+
+
+def test_command_invalidates_fresh_gets(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def run() -> None:
+        client, send = make_client(monkeypatch)
+        send.release.set()
+        await client.async_get_device()
+        await client.async_close_floating()
+        await client.async_get_device()
+        assert send.calls.count(("GET", "/device")) == 2
+
+    asyncio.run(run())
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_unchanged_config_is_returned_as_is() -> None:
+    async def run() -> None:
+        port = _free_port()
+        fleet = FakePanelFleet(FakePanelOptions(token="secret"))
+        await fleet.start(1, port)
+        try:
+            async with ClientSession() as session:
+                client = NexusViewPanelApiClient(
+                    "127.0.0.1", port, "secret", session, freshness=0
+                )
+                first = await client.async_get_config()
+                assert len(first["tabs"]) == 3
+                assert await client.async_get_config() is first
+                await client.async_set_brightness(30)
+                assert await client.async_get_config() is not first
+        finally:
+            await fleet.stop()
+
+    asyncio.run(run())
@@ -0,0 +1,123 @@
+"""Tests for the circuit breaker."""
+import pytest
+
+from custom_components.nexusviewpanel import breaker
+from custom_components.nexusviewpanel.breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+)
+from custom_components.nexusviewpanel.const import (
+    BREAKER_BASE_BACKOFF,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_JITTER,
+    BREAKER_PROBE_TIMEOUT,
+)
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(breaker.time, "monotonic", clock.monotonic)
+    return clock
+
+
+def open_breaker() -> CircuitBreaker:
+    circuit = CircuitBreaker("panel")
+    for _ in range(BREAKER_FAILURE_THRESHOLD):
+        circuit.record_failure()
+    return circuit
+
+
+def test_opens_after_threshold(clock: FakeClock) -> None:
+    circuit = CircuitBreaker("panel")
+    for _ in range(BREAKER_FAILURE_THRESHOLD - 1):
+        circuit.record_failure()
+    assert circuit.state == STATE_CLOSED
+    assert circuit.allow_request()
+
+    circuit.record_failure()
+    assert circuit.state == STATE_OPEN
+    assert circuit.blocked
+    assert not circuit.allow_request()
+
+
+def test_success_resets_failure_count(clock: FakeClock) -> None:
+    circuit = CircuitBreaker("panel")
+    for _ in range(BREAKER_FAILURE_THRESHOLD - 1):
+        circuit.record_failure()
+    circuit.record_success()
+    circuit.record_failure()
+    assert circuit.state == STATE_CLOSED
+
+
+def test_single_probe_after_backoff(clock: FakeClock) -> None:
+    circuit = open_breaker()
+    clock.now += BREAKER_BASE_BACKOFF * (1 + BREAKER_JITTER)
+    assert not circuit.blocked
+
+    assert circuit.allow_request()
+    assert circuit.state == STATE_HALF_OPEN
+    # Only the first request probes, the others wait for its outcome.
+    assert circuit.blocked
+    assert not circuit.allow_request()
+
+
+def test_released_probe_lets_next_request_probe(clock: FakeClock) -> None:
+    circuit = open_breaker()
+    clock.now += BREAKER_BASE_BACKOFF * (1 + BREAKER_JITTER)
+    assert circuit.allow_request()
+
+    circuit.release_probe()
+    assert circuit.allow_request()
+    assert not circuit.allow_request()
+
+
+def test_stuck_probe_is_replaced(clock: FakeClock) -> None:
+    circuit = open_breaker()
+    clock.now += BREAKER_BASE_BACKOFF * (1 + BREAKER_JITTER)
+    assert circuit.allow_request()
+
+    clock.now += BREAKER_PROBE_TIMEOUT - 1
+    assert not circuit.allow_request()
+    clock.now += 1
+    assert circuit.allow_request()
+
+
+def test_successful_probe_closes(clock: FakeClock) -> None:
+    circuit = open_breaker()
+    changes: list[str] = []
+    circuit.add_listener(lambda: changes.append(circuit.state))
+    clock.now += BREAKER_BASE_BACKOFF * (1 + BREAKER_JITTER)
+    assert circuit.allow_request()
+
+    circuit.record_success()
+    assert circuit.state == STATE_CLOSED
+    assert changes == [STATE_HALF_OPEN, STATE_CLOSED]
+    assert circuit.allow_request()
+
+
+def test_failed_probe_doubles_backoff(clock: FakeClock) -> None:
+    circuit = open_breaker()
+    assert circuit.retry_in <= BREAKER_BASE_BACKOFF * (1 + BREAKER_JITTER)
+    clock.now += BREAKER_BASE_BACKOFF * (1 + BREAKER_JITTER)
+    assert circuit.allow_request()
+
+    circuit.record_failure()
+    assert circuit.state == STATE_OPEN
+    assert (
+        2 * BREAKER_BASE_BACKOFF * (1 - BREAKER_JITTER)
+        <= circuit.retry_in
+        <= 2 * BREAKER_BASE_BACKOFF * (1 + BREAKER_JITTER)
+    )
@@ -0,0 +1,83 @@
+"""Tests for the per-panel request queue."""
+import asyncio
+
+from custom_components.nexusviewpanel.api import _RequestQueue
+from custom_components.nexusviewpanel.const import (
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    PRIORITY_REFRESH,
+)
+
+
+async def _request(
+    queue: _RequestQueue, priority: int, name: str, order: list[str]
+) -> None:
+    async with queue.slot(priority):
+        order.append(name)
+        await asyncio.sleep(0)
+
+
+def test_lowest_priority_value_first() -> None:
+    async def run() -> list[str]:
+        queue = _RequestQueue(1)
+        order: list[str] = []
+        async with queue.slot(PRIORITY_POLL):
+            tasks = [
+                asyncio.create_task(_request(queue, PRIORITY_POLL, "poll", order)),
+                asyncio.create_task(_request(queue, PRIORITY_REFRESH, "refresh", order)),
+                asyncio.create_task(_request(queue, PRIORITY_COMMAND, "command", order)),
+            ]
+            await asyncio.sleep(0)
+            assert not queue.has_free_slot
+        await asyncio.gather(*tasks)
+        return order
+
+    assert asyncio.run(run()) == ["command", "refresh", "poll"]
+
+
+def test_same_priority_in_arrival_order() -> None:
+    async def run() -> list[str]:
+        queue = _RequestQueue(1)
+        order: list[str] = []
+        async with queue.slot(PRIORITY_POLL):
+            tasks = [
+                asyncio.create_task(_request(queue, PRIORITY_POLL, str(i), order))
+                for i in range(5)
+            ]
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+        return order
+
+    assert asyncio.run(run()) == ["0", "1", "2", "3", "4"]
+
+
+def test_cancelled_waiter_frees_its_slot() -> None:
+    async def run() -> None:
+        queue = _RequestQueue(1)
+        order: list[str] = []
+        async with queue.slot(PRIORITY_POLL):
+            waiting = asyncio.create_task(_request(queue, PRIORITY_COMMAND, "cancelled", order))
+            other = asyncio.create_task(_request(queue, PRIORITY_POLL, "other", order))
+            await asyncio.sleep(0)
+        # The slot was handed to the first waiter, which is cancelled before
+        # it got to run.
+        waiting.cancel()
+        await asyncio.gather(waiting, other, return_exceptions=True)
+        assert order == ["other"]
+        assert queue.has_free_slot
+
+    asyncio.run(run())
+
+
+def test_raised_limit_grants_waiters() -> None:
+    async def run() -> None:
+        queue = _RequestQueue(1)
+        order: list[str] = []
+        async with queue.slot(PRIORITY_POLL):
+            task = asyncio.create_task(_request(queue, PRIORITY_POLL, "waiter", order))
+            await asyncio.sleep(0)
+            queue.set_max_concurrent(2)
+            await task
+            assert order == ["waiter"]
+
+    asyncio.run(run())
@@ -0,0 +1,118 @@
+"""Tests for the poll scheduler grid and the adaptive poll policy."""
+import pytest
+
+from custom_components.nexusviewpanel.const import (
+    ADAPTIVE_FAST_INTERVAL,
+    ADAPTIVE_IDLE_MAX_FACTOR,
+    PUSH_HEARTBEAT_INTERVAL,
+)
+from custom_components.nexusviewpanel.scheduler import AdaptivePollPolicy, _PollJob
+
+
+async def _refresh() -> None:
+    """Do nothing."""
+
+
+class FakeScheduler:
+    """Records the intervals handed over by the policy."""
+
+    def __init__(self) -> None:
+        self.intervals: dict[str, float] = {}
+
+    def async_set_interval(self, key: str, interval: float) -> None:
+        self.intervals[key] = interval
+
+
+def on_grid(job: _PollJob) -> bool:
+    """Return whether the next run is a slot on the job's phase grid."""
+    offset = (job.next_run - job.phase()) % job.interval
+    return min(offset, job.interval - offset) < 1e-6
+
+
+def test_phase_is_stable_and_within_interval() -> None:
+    phases = {_PollJob(f"entry{i}_device", _refresh, 30).phase() for i in range(20)}
+    assert all(0 <= phase < 30 for phase in phases)
+    # Different panels are spread over the interval.
+    assert len(phases) > 10
+    assert _PollJob("entry0_device", _refresh, 30).phase() in phases
+
+
+@pytest.mark.parametrize("now", [0.0, 12.5, 1000.0, 1234.567])
+def test_schedule_from_lands_on_grid_after_now(now: float) -> None:
+    job = _PollJob("entry_device", _refresh, 30)
+    job.schedule_from(now)
+    assert now < job.next_run <= now + 30
+    assert on_grid(job)
+
+
+def test_schedule_from_exact_slot_moves_to_next() -> None:
+    job = _PollJob("entry_device", _refresh, 30)
+    now = 300 + job.phase()
+    job.schedule_from(now)
+    assert job.next_run == pytest.approx(now + 30)
+
+
+@pytest.mark.parametrize("last_run", [100.0, 117.3, 250.0])
+def test_new_interval_keeps_gap_after_last_run(last_run: float) -> None:
+    job = _PollJob("entry_config", _refresh, 60)
+    job.last_run = last_run
+    job.interval = 20
+    job.schedule_after_last_run(last_run + 1)
+    due = last_run + 20
+    assert abs(job.next_run - due) <= 10
+    assert on_grid(job)
+
+
+def make_policy() -> tuple[AdaptivePollPolicy, FakeScheduler]:
+    scheduler = FakeScheduler()
+    policy = AdaptivePollPolicy("entry", scheduler, {"device": 60, "config": 300})
+    return policy, scheduler
+
+
+def test_activity_polls_fast_then_backs_off_to_configured() -> None:
+    policy, scheduler = make_policy()
+    policy.async_notify_activity()
+    assert scheduler.intervals == {
+        "entry_device": ADAPTIVE_FAST_INTERVAL,
+        "entry_config": ADAPTIVE_FAST_INTERVAL,
+    }
+
+    seen = []
+    for _ in range(6):
+        policy.async_record_poll("device", changed=False)
+        seen.append(scheduler.intervals["entry_device"])
+    assert seen == [10, 20, 40, 60, 60, 60]
+
+    policy.async_record_poll("device", changed=True)
+    assert scheduler.intervals["entry_device"] == ADAPTIVE_FAST_INTERVAL
+
+
+def test_idle_allows_slower_polling() -> None:
+    policy, scheduler = make_policy()
+    policy.async_set_idle(True)
+    for _ in range(5):
+        policy.async_record_poll("device", changed=False)
+    assert scheduler.intervals["entry_device"] == 60 * ADAPTIVE_IDLE_MAX_FACTOR
+
+    policy.async_set_idle(False)
+    assert scheduler.intervals["entry_device"] == 60
+
+
+def test_failures_back_off_up_to_idle_limit() -> None:
+    policy, scheduler = make_policy()
+    for _ in range(5):
+        policy.async_record_failure("config")
+    assert scheduler.intervals["entry_config"] == 300 * ADAPTIVE_IDLE_MAX_FACTOR
+
+
+def test_push_reduces_polling_to_heartbeat() -> None:
+    policy, scheduler = make_policy()
+    policy.async_set_push_active(True)
+    policy.async_notify_activity()
+    assert scheduler.intervals == {
+        "entry_device": PUSH_HEARTBEAT_INTERVAL,
+        "entry_config": PUSH_HEARTBEAT_INTERVAL,
+    }
+
+    policy.async_set_push_active(False)
+    assert scheduler.intervals["entry_device"] == ADAPTIVE_FAST_INTERVAL